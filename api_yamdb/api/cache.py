@@ -0,0 +1,65 @@
+from hashlib import md5
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+
+LIST_CACHE_KEY = 'api:list:{scope}:{stamp}:{uri}'
+VERSION_STAMP_KEY = 'api:stamp:{scope}'
+
+TITLES_SCOPE = 'titles'
+REVIEWS_SCOPE = 'reviews:{title_id}'
+COMMENTS_SCOPE = 'comments:{review_id}'
+
+
+def get_list_cache():
+    """Возвращает кэш для ответов списков."""
+    return caches[settings.API_LIST_CACHE_ALIAS]
+
+
+def get_version_stamp(scope):
+    """Возвращает метку версии набора данных: (версия, время изменения).
+
+    Метка хранится в кэше списков рядом с ответами и читается без
+    запросов к БД. Для набора, метки которого нет в кэше, создается
+    новая версия без времени изменения: (версия, None).
+    """
+    cache = get_list_cache()
+    key = VERSION_STAMP_KEY.format(scope=scope)
+    stamp = cache.get(key)
+    if stamp is None:
+        stamp = (uuid4().hex, None)
+        if not cache.add(key, stamp, None):
+            stamp = cache.get(key, stamp)
+    return stamp
+
+
+def set_version_stamps(scopes):
+    """Записывает наборам данных новую версию."""
+    stamp = (uuid4().hex, timezone.now())
+    get_list_cache().set_many(
+        {VERSION_STAMP_KEY.format(scope=scope): stamp for scope in scopes},
+        None
+    )
+
+
+def touch_version_stamp(*scopes):
+    """Отмечает изменение наборов данных.
+
+    Метки меняются сразу и еще раз после фиксации транзакции: ответ,
+    закэшированный по незафиксированным данным между этими моментами,
+    больше не выдается. Блокировок в БД метки не берут.
+    """
+    set_version_stamps(scopes)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: set_version_stamps(scopes))
+
+
+def get_list_cache_key(scope, stamp, uri):
+    """Ключ кэша ответа списка по метке версии и адресу запроса."""
+    version, _ = stamp
+    return LIST_CACHE_KEY.format(
+        scope=scope, stamp=version, uri=md5(uri.encode()).hexdigest()
+    )
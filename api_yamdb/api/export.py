@@ -0,0 +1,81 @@
+import csv
+import json
+
+from reviews.models import Category, Comment, Genre, Review, Title
+
+EXPORT_CHUNK_SIZE = 2000
+
+# Набор данных: имя файла в static/data, модель и пары
+# (колонка файла, поле для values_list). Колонки совпадают с форматом
+# static/data, поэтому выгрузку в CSV можно загрузить через import_csv.
+EXPORT_DATASETS = {
+    'categories': ('category.csv', Category, (
+        ('id', 'id'), ('name', 'name'), ('slug', 'slug'),
+    )),
+    'genres': ('genre.csv', Genre, (
+        ('id', 'id'), ('name', 'name'), ('slug', 'slug'),
+    )),
+    'titles': ('titles.csv', Title, (
+        ('id', 'id'), ('name', 'name'), ('year', 'year'),
+        ('category', 'category_id'), ('description', 'description'),
+    )),
+    'genre_title': ('genre_title.csv', Title.genre.through, (
+        ('id', 'id'), ('title_id', 'title_id'), ('genre_id', 'genre_id'),
+    )),
+    'reviews': ('review.csv', Review, (
+        ('id', 'id'), ('title_id', 'title_id'), ('text', 'text'),
+        ('author', 'author_id'), ('score', 'score'),
+        ('pub_date', 'pub_date'),
+    )),
+    'comments': ('comments.csv', Comment, (
+        ('id', 'id'), ('review_id', 'review_id'), ('text', 'text'),
+        ('author', 'author_id'), ('pub_date', 'pub_date'),
+    )),
+}
+
+
+class EchoBuffer:
+    """Буфер, который сразу возвращает записанную строку."""
+
+    def write(self, value):
+        return value
+
+
+def export_value(value):
+    """Приводит значение к виду файлов static/data."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat().replace('+00:00', 'Z')
+    return value
+
+
+def iter_export_rows(dataset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Построчно читает набор данных без создания объектов моделей."""
+    _, model, columns = EXPORT_DATASETS[dataset]
+    queryset = model.objects.order_by('pk').values_list(
+        *(field for _, field in columns)
+    )
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield [export_value(value) for value in row]
+
+
+def iter_export_csv(dataset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Отдает набор данных строками CSV с заголовком."""
+    _, _, columns = EXPORT_DATASETS[dataset]
+    writer = csv.writer(EchoBuffer(), lineterminator='\n')
+    yield writer.writerow([column for column, _ in columns])
+    for row in iter_export_rows(dataset, chunk_size):
+        yield writer.writerow(row)
+
+
+def iter_export_ndjson(dataset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Отдает набор данных строками JSON, по объекту на строку."""
+    _, _, columns = EXPORT_DATASETS[dataset]
+    names = [column for column, _ in columns]
+    for row in iter_export_rows(dataset, chunk_size):
+        yield json.dumps(dict(zip(names, row)), ensure_ascii=False) + '\n'
+
+
+EXPORTERS = {
+    'csv': (iter_export_csv, 'text/csv; charset=utf-8', 'csv'),
+    'ndjson': (iter_export_ndjson, 'application/x-ndjson', 'ndjson'),
+}
@@ -9,7 +9,12 @@ class TitleFilter(filters.FilterSet):
     genre = filters.CharFilter(field_name='genre__slug')
     category = filters.CharFilter(field_name='category__slug')
     name = filters.CharFilter(field_name='name', lookup_expr='icontains')
+    search = filters.CharFilter(method='filter_search')
 
     class Meta:
         model = Title
         fields = ('name', 'year', 'genre', 'category')
+
+    def filter_search(self, queryset, name, value):
+        """Полнотекстовый поиск с сортировкой по релевантности."""
+        return queryset.search(value)
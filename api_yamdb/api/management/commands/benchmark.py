@@ -0,0 +1,257 @@
+import http.client
+import json
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.contrib.auth.tokens import default_token_generator
+from django.core.management.base import BaseCommand, CommandError
+
+from api.management.commands.generate_dataset import BENCH_ADMIN_USERNAME
+from api_yamdb.instrumentation import PERCENTILES, percentile
+from reviews.models import Comment, Review, Title
+from users.models import User
+from users.utils import get_jwt_token
+
+QUERIES_RE = re.compile(r'desc="(\d+) queries"')
+DEFAULT_URL = 'http://127.0.0.1:8000'
+
+
+def get_routes(admin, comment):
+    """Маршруты api/urls.py и users/urls.py с параметрами из БД.
+
+    Элемент: имя, метод, путь, нужен ли токен и тело запроса.
+    Запросы на запись отзывов и комментариев не входят: они меняют
+    данные и упираются в ограничения частоты. Регистрация и токен
+    нагружаются успешными запросами от имени администратора набора;
+    они ограничены по IP, поэтому для замера сервер запускают
+    с большим THROTTLE_AUTH_RATE, иначе в отчете будут ответы 429.
+    """
+    review = comment.review
+    title = review.title
+    genre = title.genre.first()
+    reviews = f'/api/v1/titles/{title.id}/reviews/'
+    comments = f'{reviews}{review.id}/comments/'
+    return (
+        ('titles-list', 'GET', '/api/v1/titles/', False, None),
+        ('titles-list-cursor', 'GET', '/api/v1/titles/?cursor=', False, None),
+        (
+            'titles-list-genre', 'GET',
+            f'/api/v1/titles/?genre={genre.slug if genre else ""}',
+            False, None
+        ),
+        (
+            'titles-list-search', 'GET',
+            f'/api/v1/titles/?search={title.name.split()[0]}', False, None
+        ),
+        ('titles-detail', 'GET', f'/api/v1/titles/{title.id}/', False, None),
+        ('categories-list', 'GET', '/api/v1/categories/', False, None),
+        ('genres-list', 'GET', '/api/v1/genres/', False, None),
+        ('reviews-list', 'GET', reviews, False, None),
+        ('reviews-detail', 'GET', f'{reviews}{review.id}/', False, None),
+        ('comments-list', 'GET', comments, False, None),
+        ('comments-detail', 'GET', f'{comments}{comment.id}/', False, None),
+        ('users-list', 'GET', '/api/v1/users/', True, None),
+        (
+            'users-detail', 'GET', f'/api/v1/users/{admin.username}/',
+            True, None
+        ),
+        ('users-me', 'GET', '/api/v1/users/me/', True, None),
+        (
+            'signup', 'POST', '/api/v1/auth/signup/', False,
+            {'username': admin.username, 'email': admin.email}
+        ),
+        (
+            'token', 'POST', '/api/v1/auth/token/', False,
+            {
+                'username': admin.username,
+                'confirmation_code': default_token_generator.make_token(
+                    admin
+                ),
+            }
+        ),
+        ('export', 'GET', '/api/v1/export/genres/', True, None),
+        ('metrics', 'GET', '/api/v1/_metrics/', True, None),
+        ('prometheus-metrics', 'GET', '/metrics/', False, None),
+    )
+
+
+class Command(BaseCommand):
+    """Нагружает запущенный сервер и сообщает задержки по маршрутам."""
+
+    help = (
+        'Выполняет запросы ко всем маршрутам API и выводит p50/p95/p99, '
+        'RPS и число запросов к БД в JSON. Данные готовит generate_dataset.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'routes',
+            nargs='*',
+            help='Имена маршрутов; по умолчанию все.'
+        )
+        parser.add_argument(
+            '--url',
+            default=DEFAULT_URL,
+            help=f'Адрес сервера (по умолчанию {DEFAULT_URL}).'
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Количество запросов к каждому маршруту.'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Количество одновременных соединений.'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=5,
+            help='Запросов к маршруту перед замером.'
+        )
+        parser.add_argument(
+            '--output',
+            type=Path,
+            help='Файл для отчета; по умолчанию отчет выводится в stdout.'
+        )
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError(
+                'Количество запросов и соединений должно быть больше нуля.'
+            )
+        url = urlsplit(options['url'])
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise CommandError(f'Неверный адрес сервера: {options["url"]}')
+        admin = User.objects.filter(username=BENCH_ADMIN_USERNAME).first()
+        comment = Comment.objects.select_related('review__title').filter(
+            review__title__isnull=False
+        ).order_by('id').first()
+        if admin is None or comment is None:
+            raise CommandError(
+                'Нет данных для нагрузки: выполните generate_dataset.'
+            )
+        routes = get_routes(admin, comment)
+        unknown = set(options['routes']) - {route[0] for route in routes}
+        if unknown:
+            raise CommandError(
+                f'Неизвестные маршруты: {", ".join(sorted(unknown))}'
+            )
+
+        self.url = url
+        self.token = get_jwt_token(admin)
+        report = {
+            'url': options['url'],
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'dataset': {
+                'users': User.objects.count(),
+                'titles': Title.objects.count(),
+                'reviews': Review.objects.count(),
+                'comments': Comment.objects.count(),
+            },
+            'routes': {},
+        }
+        for route in routes:
+            if options['routes'] and route[0] not in options['routes']:
+                continue
+            self.send(route, options['warmup'])
+            report['routes'][route[0]] = self.run_route(
+                route, options['requests'], options['concurrency']
+            )
+            self.stderr.write(f'{route[0]}: готово')
+
+        content = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            options['output'].write_text(content + '\n', encoding='utf-8')
+        else:
+            self.stdout.write(content)
+
+    def run_route(self, route, total, concurrency):
+        """Делит запросы между соединениями и сводит результаты."""
+        _, method, path, _, _ = route
+        amounts = [
+            total // concurrency + (worker < total % concurrency)
+            for worker in range(concurrency)
+        ]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as executor:
+            results = list(executor.map(
+                self.send, [route] * concurrency, amounts
+            ))
+        elapsed = time.perf_counter() - started
+        samples = [sample for result in results for sample in result]
+
+        latencies = sorted(latency for latency, _, _ in samples)
+        statuses = Counter(str(status) for _, status, _ in samples)
+        queries = [amount for _, _, amount in samples if amount is not None]
+        latency_ms = {
+            f'p{percent}': round(percentile(latencies, percent) * 1000, 3)
+            for percent in PERCENTILES
+        }
+        latency_ms['max'] = round(latencies[-1] * 1000, 3)
+        return {
+            'method': method,
+            'path': path,
+            'requests': len(samples),
+            'errors': statuses.get('error', 0),
+            'statuses': dict(sorted(statuses.items())),
+            'rps': round(len(samples) / elapsed, 1),
+            'latency_ms': latency_ms,
+            'queries_per_request': (
+                round(sum(queries) / len(queries), 2) if queries else None
+            ),
+        }
+
+    def send(self, route, amount):
+        """Выполняет amount запросов через одно соединение.
+
+        Возвращает список (время, статус, число запросов к БД).
+        Число запросов берется из заголовка Server-Timing.
+        """
+        _, method, path, auth, data = route
+        connection_class = (
+            http.client.HTTPSConnection if self.url.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        connection = connection_class(self.url.hostname, self.url.port)
+        headers = {'Accept': 'application/json'}
+        body = None
+        if auth:
+            headers['Authorization'] = f'Bearer {self.token}'
+        if data is not None:
+            headers['Content-Type'] = 'application/json'
+            body = json.dumps(data).encode()
+        samples = []
+        try:
+            for _ in range(amount):
+                started = time.perf_counter()
+                try:
+                    connection.request(method, path, body, headers)
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    samples.append(
+                        (time.perf_counter() - started, 'error', None)
+                    )
+                    continue
+                latency = time.perf_counter() - started
+                match = QUERIES_RE.search(
+                    response.getheader('Server-Timing', '')
+                )
+                samples.append((
+                    latency,
+                    response.status,
+                    int(match.group(1)) if match else None,
+                ))
+        finally:
+            connection.close()
+        return samples
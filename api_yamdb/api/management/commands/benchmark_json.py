@@ -0,0 +1,82 @@
+import json
+import time
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONRenderer, orjson
+from api.serializers import ReviewSerializer, TitleSerializer
+from reviews.models import Review, Title
+
+PAGES = (
+    ('titles', Title.objects.order_by('-rating', 'id'), TitleSerializer),
+    ('reviews', Review.objects.order_by('pub_date', 'id'), ReviewSerializer),
+)
+
+
+class Command(BaseCommand):
+    """Сравнивает JSONRenderer и FastJSONRenderer на страницах API."""
+
+    help = (
+        'Замеряет кодирование страниц TitleSerializer и ReviewSerializer '
+        'стандартным и быстрым JSON-рендерером.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=100,
+            help='Количество объектов на странице.'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=200,
+            help='Сколько раз кодировать каждую страницу.'
+        )
+
+    def handle(self, *args, **options):
+        if options['page_size'] < 1 or options['repeat'] < 1:
+            raise CommandError(
+                'Размер страницы и число повторов должны быть больше нуля.'
+            )
+        if orjson is None:
+            raise CommandError('orjson не установлен.')
+        report = {}
+        for name, queryset, serializer_class in PAGES:
+            objects = serializer_class.setup_eager_loading(queryset)[
+                :options['page_size']
+            ]
+            results = serializer_class(objects, many=True).data
+            data = OrderedDict((
+                ('count', len(results)),
+                ('next', None),
+                ('previous', None),
+                ('results', results),
+            ))
+            report[name] = self.compare(data, options['repeat'])
+        self.stdout.write(json.dumps(report, indent=2))
+
+    @staticmethod
+    def compare(data, repeat):
+        """Время кодирования одной страницы каждым рендерером."""
+        timings = {}
+        outputs = {}
+        for name, renderer in (
+            ('json', JSONRenderer()), ('orjson', FastJSONRenderer())
+        ):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                outputs[name] = renderer.render(data)
+            timings[name] = (time.perf_counter() - started) / repeat
+        if outputs['json'] != outputs['orjson']:
+            raise CommandError('Вывод рендереров различается.')
+        return {
+            'objects': len(data['results']),
+            'bytes': len(outputs['json']),
+            'json_ms': round(timings['json'] * 1000, 3),
+            'orjson_ms': round(timings['orjson'] * 1000, 3),
+            'speedup': round(timings['json'] / timings['orjson'], 1),
+        }
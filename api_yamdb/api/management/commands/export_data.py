@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.export import EXPORT_CHUNK_SIZE, EXPORT_DATASETS, EXPORTERS
+
+
+class Command(BaseCommand):
+    """Выгружает наборы данных в файлы формата static/data."""
+
+    help = 'Выгружает произведения, отзывы и комментарии в CSV или NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'datasets',
+            nargs='*',
+            help=(
+                f'Наборы данных: {", ".join(EXPORT_DATASETS)}; '
+                'по умолчанию выгружаются все.'
+            )
+        )
+        parser.add_argument(
+            '--output',
+            choices=tuple(EXPORTERS),
+            default='csv',
+            help='Формат файлов.'
+        )
+        parser.add_argument(
+            '--path',
+            type=Path,
+            default=Path('.'),
+            help='Каталог для файлов.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help='Количество строк, читаемых из БД за раз.'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path.is_dir():
+            raise CommandError(f'Каталог {path} не найден.')
+        unknown = set(options['datasets']) - set(EXPORT_DATASETS)
+        if unknown:
+            raise CommandError(
+                f'Неизвестные наборы данных: {", ".join(sorted(unknown))}'
+            )
+        exporter, _, extension = EXPORTERS[options['output']]
+        for dataset in options['datasets'] or EXPORT_DATASETS:
+            filename, _, _ = EXPORT_DATASETS[dataset]
+            target = path / f'{Path(filename).stem}.{extension}'
+            with target.open('w', encoding='utf-8', newline='') as file:
+                for line in exporter(dataset, options['chunk_size']):
+                    file.write(line)
+            self.stdout.write(f'{dataset}: {target}')
+        self.stdout.write(self.style.SUCCESS('Выгрузка завершена.'))
@@ -0,0 +1,166 @@
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.cache import TITLES_SCOPE, touch_version_stamp
+from api.management.commands.import_csv import DEFAULT_BATCH_SIZE, batched
+from reviews.models import Category, Comment, Genre, Review, Title
+from users.models import User
+
+# Все синтетические объекты помечены префиксом, чтобы не пересекаться
+# с реальными данными и находить их после bulk_create.
+PREFIX = 'bench'
+BENCH_ADMIN_USERNAME = f'{PREFIX}_admin'
+TITLE_NAME_PREFIX = f'{PREFIX.title()} title '
+
+
+class Command(BaseCommand):
+    """Создает синтетический набор данных заданного размера."""
+
+    help = 'Генерирует пользователей, произведения, отзывы и комментарии.'
+
+    def add_arguments(self, parser):
+        for name, default, help_text in (
+            ('users', 100, 'Количество пользователей.'),
+            ('categories', 10, 'Количество категорий.'),
+            ('genres', 30, 'Количество жанров.'),
+            ('titles', 1000, 'Количество произведений.'),
+            ('reviews', 5, 'Отзывов на произведение (не больше users).'),
+            ('comments', 2, 'Комментариев к отзыву.'),
+            ('batch-size', DEFAULT_BATCH_SIZE, 'Размер пачки bulk_create.'),
+        ):
+            parser.add_argument(
+                f'--{name}', type=int, default=default, help=help_text
+            )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Начальное значение генератора случайных чисел.'
+        )
+
+    def handle(self, *args, **options):
+        if options['reviews'] > options['users']:
+            raise CommandError(
+                'Отзывов на произведение не может быть больше пользователей.'
+            )
+        if min(options['users'], options['categories'],
+               options['genres'], options['batch_size']) < 1:
+            raise CommandError(
+                'Пользователей, категорий, жанров и размер пачки '
+                'должно быть больше нуля.'
+            )
+        if User.objects.filter(username=BENCH_ADMIN_USERNAME).exists():
+            raise CommandError('Синтетический набор данных уже создан.')
+
+        self.random = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        with transaction.atomic():
+            user_ids = self.create_users(options['users'])
+            category_ids = self.create_named(Category, options['categories'])
+            genre_ids = self.create_named(Genre, options['genres'])
+            title_ids = self.create_titles(
+                options['titles'], category_ids, genre_ids
+            )
+            review_ids = self.create_reviews(
+                title_ids, user_ids, options['reviews']
+            )
+            self.create_comments(review_ids, user_ids, options['comments'])
+            Title.objects.filter(
+                name__startswith=TITLE_NAME_PREFIX
+            ).recalculate_rating()
+        touch_version_stamp(
+            TITLES_SCOPE, Category._meta.label, Genre._meta.label
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано: пользователей {len(user_ids) + 1}, '
+            f'произведений {len(title_ids)}, отзывов {len(review_ids)}.'
+        ))
+
+    def bulk_create(self, objects):
+        """Сохраняет поток объектов пачками."""
+        for batch in batched(objects, self.batch_size):
+            batch[0].__class__.objects.bulk_create(batch)
+
+    def create_users(self, amount):
+        password = make_password(None)
+        User.objects.create(
+            username=BENCH_ADMIN_USERNAME,
+            email=f'{BENCH_ADMIN_USERNAME}@yamdb.fake',
+            role=User.ADMIN,
+            password=password,
+        )
+        self.bulk_create(
+            User(
+                username=f'{PREFIX}_user_{number}',
+                email=f'{PREFIX}_user_{number}@yamdb.fake',
+                password=password,
+            )
+            for number in range(amount)
+        )
+        return list(User.objects.filter(
+            username__startswith=f'{PREFIX}_user_'
+        ).values_list('id', flat=True))
+
+    def create_named(self, model, amount):
+        name = model._meta.model_name
+        self.bulk_create(
+            model(
+                name=f'{name.title()} {number}',
+                slug=f'{PREFIX}-{name}-{number}',
+            )
+            for number in range(amount)
+        )
+        return list(model.objects.filter(
+            slug__startswith=f'{PREFIX}-{name}-'
+        ).values_list('id', flat=True))
+
+    def create_titles(self, amount, category_ids, genre_ids):
+        self.bulk_create(
+            Title(
+                name=f'{TITLE_NAME_PREFIX}{number}',
+                year=self.random.randint(1900, 2020),
+                description=f'Description {number}',
+                category_id=self.random.choice(category_ids),
+            )
+            for number in range(amount)
+        )
+        title_ids = list(Title.objects.filter(
+            name__startswith=TITLE_NAME_PREFIX
+        ).values_list('id', flat=True))
+        self.bulk_create(
+            Title.genre.through(title_id=title_id, genre_id=genre_id)
+            for title_id in title_ids
+            for genre_id in self.random.sample(
+                genre_ids, min(len(genre_ids), self.random.randint(1, 3))
+            )
+        )
+        return title_ids
+
+    def create_reviews(self, title_ids, user_ids, per_title):
+        self.bulk_create(
+            Review(
+                title_id=title_id,
+                author_id=author_id,
+                text=f'Review of {title_id} by {author_id}',
+                score=self.random.randint(1, 10),
+            )
+            for title_id in title_ids
+            for author_id in self.random.sample(user_ids, per_title)
+        )
+        return list(Review.objects.filter(
+            title__name__startswith=TITLE_NAME_PREFIX
+        ).values_list('id', flat=True).iterator())
+
+    def create_comments(self, review_ids, user_ids, per_review):
+        self.bulk_create(
+            Comment(
+                review_id=review_id,
+                author_id=self.random.choice(user_ids),
+                text=f'Comment {number} on review {review_id}',
+            )
+            for review_id in review_ids
+            for number in range(per_review)
+        )
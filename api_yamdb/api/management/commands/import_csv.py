@@ -0,0 +1,253 @@
+import csv
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from api.cache import (
+    COMMENTS_SCOPE, REVIEWS_SCOPE, TITLES_SCOPE, touch_version_stamp
+)
+from reviews.models import Category, Comment, Genre, Review, Title
+from users.models import User
+
+DEFAULT_DATA_DIR = Path(settings.BASE_DIR) / 'static' / 'data'
+DEFAULT_BATCH_SIZE = 1000
+
+
+def build_user(row, known_ids):
+    return User(
+        id=row['id'],
+        username=row['username'],
+        email=row['email'],
+        role=row['role'] or User.USER,
+        bio=row['bio'],
+        first_name=row['first_name'],
+        last_name=row['last_name'],
+        password=make_password(None),
+    )
+
+
+def build_category(row, known_ids):
+    return Category(id=row['id'], name=row['name'], slug=row['slug'])
+
+
+def build_genre(row, known_ids):
+    return Genre(id=row['id'], name=row['name'], slug=row['slug'])
+
+
+def build_title(row, known_ids):
+    category_id = int(row['category']) if row['category'] else None
+    if category_id not in known_ids[Category]:
+        category_id = None
+    return Title(
+        id=row['id'],
+        name=row['name'],
+        year=row['year'],
+        description=row.get('description', ''),
+        category_id=category_id,
+    )
+
+
+def build_genre_title(row, known_ids):
+    title_id, genre_id = int(row['title_id']), int(row['genre_id'])
+    if title_id not in known_ids[Title] or genre_id not in known_ids[Genre]:
+        return None
+    return Title.genre.through(
+        id=row['id'], title_id=title_id, genre_id=genre_id
+    )
+
+
+def build_review(row, known_ids):
+    title_id, author_id = int(row['title_id']), int(row['author'])
+    if title_id not in known_ids[Title] or author_id not in known_ids[User]:
+        return None
+    return Review(
+        id=row['id'],
+        title_id=title_id,
+        author_id=author_id,
+        text=row['text'],
+        score=row['score'],
+        pub_date=parse_datetime(row['pub_date']),
+    )
+
+
+def build_comment(row, known_ids):
+    review_id, author_id = int(row['review_id']), int(row['author'])
+    if review_id not in known_ids[Review] or author_id not in known_ids[User]:
+        return None
+    return Comment(
+        id=row['id'],
+        review_id=review_id,
+        author_id=author_id,
+        text=row['text'],
+        pub_date=parse_datetime(row['pub_date']),
+    )
+
+
+# Файлы в порядке зависимостей: модель, на которую ссылаются строки,
+# загружается раньше ссылающейся.
+IMPORT_PLAN = (
+    ('users.csv', User, build_user),
+    ('category.csv', Category, build_category),
+    ('genre.csv', Genre, build_genre),
+    ('titles.csv', Title, build_title),
+    ('genre_title.csv', Title.genre.through, build_genre_title),
+    ('review.csv', Review, build_review),
+    ('comments.csv', Comment, build_comment),
+)
+
+
+@contextmanager
+def keep_auto_now_add(model):
+    """Временно отключает auto_now_add, чтобы сохранить даты из файла."""
+    fields = [
+        field for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now_add', False)
+    ]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def batched(iterable, size):
+    """Разбивает поток строк на списки не длиннее size."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class Command(BaseCommand):
+    """Загружает CSV-файлы static/data пачками через bulk_create."""
+
+    help = 'Импортирует данные из CSV-файлов в БД.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path',
+            type=Path,
+            default=DEFAULT_DATA_DIR,
+            help='Каталог с CSV-файлами (по умолчанию static/data).'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Количество строк в одной пачке bulk_create.'
+        )
+        parser.add_argument(
+            '--ignore-conflicts',
+            action='store_true',
+            help='Пропускать строки, уже существующие в БД.'
+        )
+        parser.add_argument(
+            '--skip-rating',
+            action='store_true',
+            help='Не пересчитывать рейтинг произведений после загрузки.'
+        )
+
+    def handle(self, *args, **options):
+        data_dir = options['path']
+        if not data_dir.is_dir():
+            raise CommandError(f'Каталог {data_dir} не найден.')
+        if options['batch_size'] < 1:
+            raise CommandError('Размер пачки должен быть больше нуля.')
+
+        known_ids = {}
+        for filename, model, build in IMPORT_PLAN:
+            path = data_dir / filename
+            if path.exists():
+                created, skipped = self.import_file(
+                    path, model, build, known_ids, options
+                )
+                self.stdout.write(
+                    f'{filename}: загружено {created}, пропущено {skipped}'
+                )
+            known_ids[model] = set(
+                model.objects.values_list('pk', flat=True).iterator()
+            )
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(), [model for _, model, _ in IMPORT_PLAN]
+            ):
+                cursor.execute(sql)
+
+        if not options['skip_rating']:
+            Title.objects.recalculate_rating()
+        touch_version_stamp(
+            TITLES_SCOPE, Category._meta.label, Genre._meta.label
+        )
+        self.stdout.write(self.style.SUCCESS('Импорт завершен.'))
+
+    def import_file(self, path, model, build, known_ids, options):
+        """Загружает один файл в одной транзакции.
+
+        Возвращает число загруженных и пропущенных строк. С
+        --ignore-conflicts БД молча пропускает существующие строки,
+        поэтому загруженные считаются по числу строк таблицы до и после.
+        """
+        with path.open(encoding='utf-8', newline='') as csv_file:
+            rows = csv.DictReader(csv_file)
+            with transaction.atomic(), keep_auto_now_add(model):
+                if options['ignore_conflicts']:
+                    count_before = model.objects.count()
+                attempted, skipped = self.import_rows(
+                    rows, model, build, known_ids, options
+                )
+                created = attempted
+                if options['ignore_conflicts']:
+                    created = model.objects.count() - count_before
+                    skipped += attempted - created
+        return created, skipped
+
+    def import_rows(self, rows, model, build, known_ids, options):
+        """Загружает строки пачками.
+
+        Возвращает число переданных в БД и отброшенных строк.
+        """
+        created = skipped = 0
+        for batch in batched(rows, options['batch_size']):
+            objects = [
+                obj for obj in (build(row, known_ids) for row in batch)
+                if obj is not None
+            ]
+            skipped += len(batch) - len(objects)
+            model.objects.bulk_create(
+                objects,
+                batch_size=options['batch_size'],
+                ignore_conflicts=options['ignore_conflicts'],
+            )
+            created += len(objects)
+            self.touch_nested_scopes(model, objects)
+        return created, skipped
+
+    @staticmethod
+    def touch_nested_scopes(model, objects):
+        """Сбрасывает метки версий вложенных списков загруженной пачки."""
+        if model is Review:
+            scopes = {
+                REVIEWS_SCOPE.format(title_id=obj.title_id)
+                for obj in objects
+            }
+        elif model is Comment:
+            scopes = {
+                COMMENTS_SCOPE.format(review_id=obj.review_id)
+                for obj in objects
+            }
+        else:
+            return
+        if scopes:
+            touch_version_stamp(*scopes)
@@ -1,11 +1,313 @@
+from hashlib import md5
+from time import time
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, viewsets, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer
 
+from api_yamdb.instrumentation import count_cache_lookup
+from api.cache import get_list_cache, get_list_cache_key, get_version_stamp
 from api.permissions import IsAdminOrReadOnly
+from api.values import ValuesSerializer, get_values_mapper
+
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+
+def get_sparse_fieldset(request):
+    """Возвращает поля из параметров fields и omit запроса на чтение.
+
+    Результат — (запрошенные поля или None, исключенные поля).
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None, ()
+    params = getattr(request, 'query_params', request.GET)
+    requested, omitted = (
+        tuple(
+            name.strip() for name in params.get(param, '').split(',')
+            if name.strip()
+        )
+        for param in (FIELDS_QUERY_PARAM, OMIT_QUERY_PARAM)
+    )
+    return requested or None, omitted
+
+
+class SparseFieldsetSerializerMixin:
+    """Mixin сериализатора, выводящий только поля из ?fields=
+    и без полей из ?omit=.
+
+    Действует на запросах на чтение и только на корневой сериализатор:
+    вложенные сериализаторы выводятся целиком.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+        requested, omitted = get_sparse_fieldset(self.context.get('request'))
+        for param, names in (
+            (FIELDS_QUERY_PARAM, requested or ()),
+            (OMIT_QUERY_PARAM, omitted),
+        ):
+            unknown = [name for name in names if name not in fields]
+            if unknown:
+                raise ValidationError({
+                    param: [f'Неизвестные поля: {", ".join(unknown)}']
+                })
+        return {
+            name: field for name, field in fields.items()
+            if (requested is None or name in requested)
+            and name not in omitted
+        }
+
+
+class EagerLoadingSerializerMixin:
+    """Mixin сериализатора, описывающий связи для жадной загрузки.
+
+    select_related_fields и prefetch_related_fields перечисляют связи,
+    которые сериализатор читает при выводе.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, required=()):
+        """Подготавливает queryset под поля сериализатора.
+
+        Если передан fields — имена выводимых полей, то связи остальных
+        полей не загружаются, а их колонки откладываются через defer,
+        кроме перечисленных в required.
+        """
+        select_related = cls.select_related_fields
+        prefetch_related = cls.prefetch_related_fields
+        if fields is not None:
+            select_related = [
+                name for name in select_related
+                if name.split('__')[0] in fields
+            ]
+            prefetch_related = [
+                name for name in prefetch_related
+                if name.split('__')[0] in fields
+            ]
+            deferred = cls.get_deferred_columns(
+                queryset.model, fields, required
+            )
+            if deferred:
+                queryset = queryset.defer(*deferred)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    @classmethod
+    def get_deferred_columns(cls, model, fields, required):
+        """Колонки модели, которые выводят только невыбранные поля."""
+        deferred = []
+        for name in cls.Meta.fields:
+            if name in fields or name in required:
+                continue
+            field = next((
+                field for field in model._meta.concrete_fields
+                if field.name == name
+            ), None)
+            if field is not None and not field.primary_key and (
+                not field.is_relation
+            ):
+                deferred.append(name)
+        return deferred
+
+
+class EagerLoadingViewSetMixin:
+    """Mixin вьюсета, применяющий жадную загрузку сериализатора.
+
+    Подготовка выполняется в filter_queryset, через который проходят
+    и list, и get_object, поэтому вьюсетам со своим get_queryset
+    ничего дополнительно делать не нужно. Загружаются только связи
+    и колонки полей, которые останутся после ?fields= и ?omit=.
+    """
+
+    def filter_queryset(self, queryset):
+        """Возвращает queryset, подготовленный под сериализатор."""
+        queryset = super().filter_queryset(queryset)
+        serializer = self.get_serializer()
+        setup_eager_loading = getattr(
+            serializer, 'setup_eager_loading', None
+        )
+        if setup_eager_loading is None:
+            return queryset
+        return setup_eager_loading(
+            queryset,
+            fields=serializer.fields,
+            required={
+                field.lstrip('-')
+                for field in getattr(self, 'keyset_ordering', ())
+            },
+        )
+
+
+class ValuesReadViewSetMixin:
+    """Mixin вьюсета, читающий list и retrieve через values().
+
+    Для JSON-ответов queryset сводится к values() с колонками полей
+    сериализатора (связи — через JOIN), а вместо сериализатора строки
+    выводит ValuesSerializer. Ответ совпадает с обычным путем; если поля
+    сериализатора так вывести нельзя, используется обычный путь.
+    Отключается настройкой API_VALUES_READ_PATH.
+    """
+
+    values_read_actions = ('list', 'retrieve')
+
+    def get_values_mapper(self):
+        """Возвращает ValuesMapper для текущего запроса или None."""
+        if not hasattr(self, '_values_mapper'):
+            self._values_mapper = None
+            if (
+                settings.API_VALUES_READ_PATH
+                and self.action in self.values_read_actions
+                and self.request.accepted_renderer.format == 'json'
+            ):
+                serializer = self.get_serializer()
+                self._values_mapper = get_values_mapper(
+                    serializer.__class__, tuple(serializer.fields)
+                )
+        return self._values_mapper
+
+    def filter_queryset(self, queryset):
+        """Сводит queryset к колонкам сериализатора и ключа пагинации."""
+        queryset = super().filter_queryset(queryset)
+        mapper = self.get_values_mapper()
+        if mapper is None:
+            return queryset
+        columns = mapper.columns | {
+            field.lstrip('-') for field in getattr(
+                self, 'keyset_ordering', ()
+            )
+        }
+        return queryset.prefetch_related(None).values(*sorted(columns))
+
+    def get_serializer(self, *args, **kwargs):
+        mapper = self.get_values_mapper()
+        if mapper is None or not args:
+            return super().get_serializer(*args, **kwargs)
+        return ValuesSerializer(
+            mapper, args[0], many=kwargs.get('many', False)
+        )
+
+
+class VersionScopeMixin:
+    """Mixin, задающий набор данных, метка версии которого
+    описывает ответы вьюсета."""
+
+    version_scope = None
+
+    def get_version_scope(self):
+        """Возвращает имя набора данных для меток версий."""
+        return self.version_scope or self.queryset.model._meta.label
+
+    def get_version_stamp(self):
+        """Возвращает метку версии, прочитанную один раз за запрос."""
+        if not hasattr(self, '_version_stamp'):
+            self._version_stamp = get_version_stamp(self.get_version_scope())
+        return self._version_stamp
+
+
+class ConditionalListMixin(VersionScopeMixin):
+    """Mixin условных GET-запросов к списку по метке версии.
+
+    ETag и Last-Modified строятся из метки версии, которая читается
+    из кэша списков, поэтому на совпавший If-None-Match
+    или If-Modified-Since вьюсет отвечает 304 без запросов к БД.
+    """
+
+    def get_validators(self, request):
+        """Возвращает ETag и Last-Modified для запроса.
+
+        Last-Modified с точностью до секунды — конец секунды изменения.
+        Пока эта секунда не прошла, в ней возможны новые изменения с той
+        же датой, поэтому Last-Modified не отдается и If-Modified-Since
+        не проверяется: актуальность определяет только ETag.
+        """
+        version, modified = self.get_version_stamp()
+        etag = md5(
+            f'{version}:{modified}:{request.build_absolute_uri()}:'
+            f'{request.META.get("HTTP_ACCEPT", "")}'.encode()
+        ).hexdigest()
+        last_modified = None
+        if modified is not None:
+            last_modified = int(modified.timestamp()) + 1
+            if time() < last_modified:
+                last_modified = None
+        return quote_etag(etag), last_modified
+
+    def conditional(self, handler, request, *args, **kwargs):
+        """Вызывает обработчик, если у клиента нет актуальной версии."""
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (
+            status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED
+        ):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(super().list, request, *args, **kwargs)
+
+
+class ConditionalGetMixin(ConditionalListMixin):
+    """Mixin условных GET-запросов к списку и к объекту."""
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional(super().retrieve, request, *args, **kwargs)
+
+
+class CachedListMixin(VersionScopeMixin):
+    """Mixin, который кэширует ответ списка по полному адресу запроса.
+
+    Ключ включает метку версии набора данных, которую сигналы меняют
+    при сохранении и удалении объектов, поэтому время жизни записи —
+    лишь страховка. Метка хранится в том же кэше, так что ответ
+    из кэша не обращается к БД.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """Возвращает список из кэша или формирует и кэширует его."""
+        cache = get_list_cache()
+        key = get_list_cache_key(
+            self.get_version_scope(), self.get_version_stamp(),
+            request.build_absolute_uri()
+        )
+        data = cache.get(key)
+        count_cache_lookup(request, data is not None)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.API_LIST_CACHE_TIMEOUT)
+        return response
 
 
 class ListCreateDestroyViewSet(
+    ConditionalListMixin,
+    CachedListMixin,
+    EagerLoadingViewSetMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -0,0 +1,187 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections import OrderedDict
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetOrPageNumberPagination(PageNumberPagination):
+    """Постраничная пагинация с необязательным режимом keyset.
+
+    По умолчанию работает как PageNumberPagination. Если в запросе есть
+    параметр cursor (для первой страницы пустой), выборка идет по ключу
+    из полей сортировки queryset (или keyset_ordering вьюсета, если
+    queryset не отсортирован явно) без OFFSET и без COUNT(*).
+    Точное количество объектов в этом режиме возвращается только
+    при count=true.
+    """
+
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    keyset_ordering = ('id',)
+    invalid_cursor_message = 'Неверный курсор.'
+    invalid_ordering_message = (
+        'Курсор нельзя использовать с этой сортировкой.'
+    )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset_mode = self.cursor_query_param in request.query_params
+        if not self.keyset_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.ordering = self.get_keyset_ordering(queryset, view)
+        self.page_size = self.get_page_size(request)
+        self.count = None
+        if request.query_params.get(self.count_query_param) == 'true':
+            self.count = queryset.count()
+
+        queryset = queryset.order_by(*(
+            self.get_order_expression(field, descending, nullable)
+            for field, descending, nullable in self.ordering
+        ))
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_after_filter(position))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        if not self.keyset_mode:
+            return super().get_paginated_response(data)
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['results'] = data
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.keyset_mode:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = [
+            self.encode_value(self.get_row_value(last, field))
+            for field, _, _ in self.ordering
+        ]
+        cursor = urlsafe_b64encode(json.dumps(position).encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            cursor
+        )
+
+    def get_keyset_ordering(self, queryset, view):
+        """Возвращает поля ключа: (имя, по убыванию, допускает NULL).
+
+        Ключ строится из сортировки queryset, которую задали вьюсет,
+        OrderingFilter или поиск, и дополняется первичным ключом. Если
+        сортировка идет не по полям модели (например, по релевантности
+        поиска), курсор с ней не сочетается и запрос отклоняется.
+        """
+        ordering = queryset.query.order_by or getattr(
+            view, 'keyset_ordering', self.keyset_ordering
+        )
+        pk_name = queryset.model._meta.pk.name
+        result = []
+        for field in ordering:
+            name = field.lstrip('-') if isinstance(field, str) else None
+            if name == 'pk':
+                name = pk_name
+            try:
+                model_field = queryset.model._meta.get_field(name or '')
+            except FieldDoesNotExist:
+                model_field = None
+            if model_field is None or model_field.is_relation:
+                raise ValidationError({
+                    self.cursor_query_param: [self.invalid_ordering_message]
+                })
+            result.append((name, field.startswith('-'), model_field.null))
+        if pk_name not in {name for name, _, _ in result}:
+            result.append((pk_name, False, False))
+        return result
+
+    @staticmethod
+    def get_order_expression(field, descending, nullable):
+        """Сортировка по полю ключа; NULL всегда идут последними."""
+        if not nullable:
+            return f'-{field}' if descending else field
+        if descending:
+            return F(field).desc(nulls_last=True)
+        return F(field).asc(nulls_last=True)
+
+    def get_after_filter(self, position):
+        """Условие «строго после позиции» в лексикографическом порядке."""
+        conditions = []
+        prefix = Q()
+        for (field, descending, nullable), value in zip(
+            self.ordering, position
+        ):
+            if value is None:
+                prefix &= Q(**{f'{field}__isnull': True})
+                continue
+            lookup = 'lt' if descending else 'gt'
+            after = Q(**{f'{field}__{lookup}': value})
+            if nullable:
+                after |= Q(**{f'{field}__isnull': True})
+            conditions.append(prefix & after)
+            prefix &= Q(**{field: value})
+        return reduce(or_, conditions)
+
+    def decode_cursor(self, request, model):
+        """Возвращает позицию из параметра cursor или None."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(urlsafe_b64decode(encoded.encode()))
+            if (
+                not isinstance(position, list)
+                or len(position) != len(self.ordering)
+            ):
+                raise ValueError
+            return [
+                self.decode_value(model, field, nullable, value)
+                for (field, _, nullable), value in zip(
+                    self.ordering, position
+                )
+            ]
+        except (BinasciiError, DjangoValidationError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def decode_value(model, field, nullable, value):
+        """Приводит значение из курсора к типу поля модели."""
+        if value is None:
+            if not nullable:
+                raise ValueError
+            return None
+        return model._meta.get_field(field).to_python(value)
+
+    @staticmethod
+    def get_row_value(row, field):
+        """Значение поля из объекта модели или строки values()."""
+        if isinstance(row, dict):
+            return row[field]
+        return getattr(row, field)
+
+    @staticmethod
+    def encode_value(value):
+        """Приводит значение поля к виду, пригодному для JSON."""
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
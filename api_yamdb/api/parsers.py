@@ -0,0 +1,31 @@
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from api.renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser, который разбирает тело запроса через orjson.
+
+    orjson, как и JSONParser при STRICT_JSON, не принимает NaN
+    и Infinity. Без orjson, для кодировки, отличной от UTF-8, и при
+    STRICT_JSON=False используется обычный JSONParser.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get(
+            'encoding', settings.DEFAULT_CHARSET
+        )
+        if (
+            orjson is None
+            or not self.strict
+            or encoding.lower().replace('_', '-') not in ('utf-8', 'utf8')
+        ):
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -0,0 +1,56 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATORS = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer, который кодирует ответ через orjson.
+
+    Вывод совпадает с JSONRenderer побайтно: даты, время, Decimal
+    и ленивые строки передаются в default кодировщика DRF, а символы
+    U+2028 и U+2029 экранируются так же. Отличаются только формат
+    экспоненты у очень больших и малых float (1e16 вместо 1e+16)
+    и NaN, который orjson выводит как null; сериализаторы API таких
+    значений не отдают.
+
+    Без orjson, с отступами или с настройками UNICODE_JSON=False
+    и COMPACT_JSON=False используется обычный JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(
+                accepted_media_type, renderer_context or {}
+            ) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=(
+                    orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        except orjson.JSONEncodeError:
+            # Например, int больше 64 бит: stdlib json справится
+            # или выдаст ту же ошибку, что и раньше.
+            return super().render(data, accepted_media_type, renderer_context)
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in ret:
+                ret = ret.replace(separator, escaped)
+        return ret
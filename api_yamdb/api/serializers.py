@@ -1,14 +1,20 @@
 import datetime as dt
 
-from django.db.models import Avg
+from django.db import IntegrityError
+from django.db.models import prefetch_related_objects
 from rest_framework import serializers
-from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.exceptions import ValidationError
 from rest_framework.relations import SlugRelatedField
+from rest_framework.settings import api_settings
 
+from api.mixins import (
+    EagerLoadingSerializerMixin, SparseFieldsetSerializerMixin
+)
 from reviews.models import Category, Comment, Genre, Review, Title
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetSerializerMixin,
+                         serializers.ModelSerializer):
     """Сериализатор Категории"""
 
     class Meta:
@@ -17,7 +23,8 @@ class CategorySerializer(serializers.ModelSerializer):
         lookup_field = 'slug'
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(SparseFieldsetSerializerMixin,
+                      serializers.ModelSerializer):
     """Сериализатор Жанра"""
 
     class Meta:
@@ -25,9 +32,14 @@ class GenreSerializer(serializers.ModelSerializer):
         model = Genre
 
 
-class TitleSerializer(serializers.ModelSerializer):
+class TitleSerializer(SparseFieldsetSerializerMixin,
+                      EagerLoadingSerializerMixin,
+                      serializers.ModelSerializer):
     """Сериализатор для модели Title."""
 
+    select_related_fields = ('category',)
+    prefetch_related_fields = ('genre',)
+
     category = CategorySerializer(read_only=True)
     genre = GenreSerializer(many=True, read_only=True)
     rating = serializers.IntegerField(read_only=True)
@@ -38,9 +50,13 @@ class TitleSerializer(serializers.ModelSerializer):
                   'description', 'genre', 'category')
 
 
-class TitleSaveSerializer(serializers.ModelSerializer):
+class TitleSaveSerializer(EagerLoadingSerializerMixin,
+                          serializers.ModelSerializer):
     """Сериализатор Произведения"""
 
+    select_related_fields = ('category',)
+    prefetch_related_fields = ('genre',)
+
     category = serializers.SlugRelatedField(
         slug_field='slug',
         queryset=Category.objects.all(),
@@ -65,17 +81,22 @@ class TitleSaveSerializer(serializers.ModelSerializer):
         return value
 
     def to_representation(self, instance):
-        """Методот вывода информации при Get запросе"""
-        representation = TitleSerializer().to_representation(instance)
-        representation['rating'] = instance.reviews.aggregate(
-            Avg('score')
-        )['score__avg']
-        return representation
+        """Методот вывода информации при Get запросе.
 
+        Рейтинг берется из хранимого поля, а жанры, кэш которых сбросила
+        запись, читаются одним запросом в порядке Genre.Meta.ordering.
+        """
+        prefetch_related_objects([instance], 'genre')
+        return TitleSerializer(instance, context=self.context).data
 
-class ReviewSerializer(serializers.ModelSerializer):
+
+class ReviewSerializer(SparseFieldsetSerializerMixin,
+                       EagerLoadingSerializerMixin,
+                       serializers.ModelSerializer):
     """Сериализатор Ревью"""
 
+    select_related_fields = ('author',)
+
     author = SlugRelatedField(
         slug_field='username',
         read_only=True,
@@ -85,26 +106,35 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ('id', 'text', 'author', 'score', 'pub_date')
         model = Review
 
-    def validate(self, data):
-        if self.context['request'].method != 'POST':
-            return data
-        title_id = self.context['request'].parser_context['kwargs'].get(
-            'title_id')
-        author = self.context['request'].user
-        if Review.objects.filter(
-            title__id=title_id,
-            author=author
-        ).exists():
-            raise ValidationError(
-                detail=(f'Отзыв {author} на произведения с '
-                        f'id={title_id} уже существует')
-            )
-        return data
-
-
-class CommentSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        """Создает отзыв, полагаясь на ограничение unique_review.
+
+        Повторный отзыв отсекает сама БД, поэтому проверочный запрос
+        выполняется только после ошибки вставки. Review.save сам
+        выполняется в транзакции, и ошибка не ломает внешнюю.
+        """
+        title = validated_data['title']
+        author = validated_data['author']
+        try:
+            return super().create(validated_data)
+        except IntegrityError:
+            if not Review.objects.filter(title=title, author=author).exists():
+                raise
+        raise ValidationError({
+            api_settings.NON_FIELD_ERRORS_KEY: [
+                f'Отзыв {author} на произведения с '
+                f'id={title.pk} уже существует'
+            ]
+        })
+
+
+class CommentSerializer(SparseFieldsetSerializerMixin,
+                        EagerLoadingSerializerMixin,
+                        serializers.ModelSerializer):
     """Сериализатор Комментария"""
 
+    select_related_fields = ('author',)
+
     author = serializers.SlugRelatedField(
         read_only=True, slug_field='username',
         default=serializers.CurrentUserDefault()
@@ -116,10 +146,11 @@ class CommentSerializer(serializers.ModelSerializer):
         read_only_fields = ('review',)
 
     def validate(self, data):
-        title_id = self.context['request'].parser_context['kwargs'].get(
-            'title_id')
-        if not Title.objects.filter(pk=title_id).exists():
-            raise NotFound(
-                detail=f'Произведения с id={title_id} не существует'
-            )
+        """Проверяет, что отзыв существует и относится к произведению.
+
+        Отзыв запоминается во вьюсете и переиспользуется при сохранении.
+        """
+        if self.context['request'].method != 'POST':
+            return data
+        self.context['view'].get_review()
         return data
@@ -0,0 +1,147 @@
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+
+from api.cache import (
+    COMMENTS_SCOPE, REVIEWS_SCOPE, TITLES_SCOPE, touch_version_stamp
+)
+from reviews.models import (
+    Category, Comment, Genre, Review, Title, comments_deleted, reviews_deleted
+)
+from users.models import User
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def touch_catalogue(sender, **kwargs):
+    """Отмечает изменение списка категорий или жанров.
+
+    Названия категорий и жанров выводятся и в произведениях.
+    """
+    touch_version_stamp(sender._meta.label, TITLES_SCOPE)
+
+
+@receiver(post_save, sender=Title)
+def touch_titles(sender, **kwargs):
+    """Отмечает изменение произведений."""
+    touch_version_stamp(TITLES_SCOPE)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def touch_title_genres(sender, action, **kwargs):
+    """Отмечает изменение жанров произведений."""
+    if action.startswith('post_'):
+        touch_version_stamp(TITLES_SCOPE)
+
+
+@receiver(pre_delete, sender=Title)
+def touch_deleted_title(sender, instance, **kwargs):
+    """Отмечает удаление произведения, его отзывов и комментариев."""
+    touch_version_stamp(
+        TITLES_SCOPE,
+        REVIEWS_SCOPE.format(title_id=instance.pk),
+        *(
+            COMMENTS_SCOPE.format(review_id=review_id)
+            for review_id in Review.objects.filter(
+                title=instance
+            ).values_list('pk', flat=True)
+        )
+    )
+
+
+@receiver(post_save, sender=Review)
+def touch_reviews(sender, instance, **kwargs):
+    """Отмечает изменение отзывов и рейтинга произведения."""
+    touch_version_stamp(
+        TITLES_SCOPE,
+        REVIEWS_SCOPE.format(title_id=instance.title_id),
+        COMMENTS_SCOPE.format(review_id=instance.pk),
+    )
+
+
+@receiver(reviews_deleted)
+def touch_deleted_reviews(sender, review_ids, title_ids, **kwargs):
+    """Отмечает удаление отзывов одним обновлением меток."""
+    touch_version_stamp(
+        TITLES_SCOPE,
+        *(REVIEWS_SCOPE.format(title_id=title_id) for title_id in title_ids),
+        *(
+            COMMENTS_SCOPE.format(review_id=review_id)
+            for review_id in review_ids
+        )
+    )
+
+
+@receiver(post_save, sender=Comment)
+def touch_comments(sender, instance, **kwargs):
+    """Отмечает изменение комментариев к отзыву."""
+    touch_version_stamp(COMMENTS_SCOPE.format(review_id=instance.review_id))
+
+
+@receiver(comments_deleted)
+def touch_deleted_comments(sender, review_ids, **kwargs):
+    """Отмечает удаление комментариев."""
+    touch_version_stamp(*(
+        COMMENTS_SCOPE.format(review_id=review_id) for review_id in review_ids
+    ))
+
+
+@receiver(pre_save, sender=User)
+def remember_username_change(sender, instance, update_fields=None,
+                             **kwargs):
+    """Запоминает, меняется ли имя существующего пользователя."""
+    instance._username_changed = (
+        not instance._state.adding
+        and (update_fields is None or 'username' in update_fields)
+        and not User.objects.filter(
+            pk=instance.pk, username=instance.username
+        ).exists()
+    )
+
+
+def get_author_scopes(user):
+    """Наборы данных, в которых выводятся отзывы и комментарии автора."""
+    review_rows = list(
+        Review.objects.filter(author=user).values_list('pk', 'title_id')
+    )
+    return [
+        REVIEWS_SCOPE.format(title_id=title_id)
+        for title_id in {title_id for _, title_id in review_rows}
+    ] + [
+        COMMENTS_SCOPE.format(review_id=review_id)
+        for review_id in {review_id for review_id, _ in review_rows} | set(
+            Comment.objects.filter(author=user).values_list(
+                'review_id', flat=True
+            )
+        )
+    ]
+
+
+@receiver(post_save, sender=User)
+def touch_author_scopes(sender, instance, **kwargs):
+    """Отмечает изменение отзывов и комментариев переименованного автора.
+
+    Имя автора выводится в отзывах и комментариях.
+    """
+    if not getattr(instance, '_username_changed', False):
+        return
+    instance._username_changed = False
+    scopes = get_author_scopes(instance)
+    if scopes:
+        touch_version_stamp(*scopes)
+
+
+@receiver(pre_delete, sender=User)
+def touch_deleted_author_scopes(sender, instance, **kwargs):
+    """Отмечает удаление отзывов и комментариев удаляемого автора.
+
+    Отзывы и комментарии удаляются каскадно без сигналов, поэтому
+    метки меняются заранее одним обновлением; рейтинг произведений
+    тоже меняется.
+    """
+    scopes = get_author_scopes(instance)
+    if scopes:
+        touch_version_stamp(TITLES_SCOPE, *scopes)
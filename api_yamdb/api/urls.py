@@ -4,7 +4,9 @@ from rest_framework.routers import DefaultRouter
 from api.views import (
     CategoryViewSet,
     CommentViewSet,
+    ExportView,
     GenreViewSet,
+    MetricsView,
     ReviewViewSet,
     TitleViewSet
 )
@@ -28,5 +30,11 @@ router_v1.register(
 
 urlpatterns = [
     path('v1/', include('users.urls')),
+    path(
+        'v1/export/<str:dataset>/',
+        ExportView.as_view(),
+        name='export'
+    ),
+    path('v1/_metrics/', MetricsView.as_view(), name='metrics'),
     path('v1/', include(router_v1.urls)),
 ]
@@ -0,0 +1,212 @@
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import SlugRelatedField
+
+
+class NotCompilable(Exception):
+    """Поле сериализатора нельзя вывести из строки values()."""
+
+
+def get_column(model, source):
+    """Имя поля модели без связи, доступного в values()."""
+    if source == 'pk':
+        return model._meta.pk.name
+    if '.' in source or source == '*':
+        raise NotCompilable(source)
+    try:
+        field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        raise NotCompilable(source)
+    if field.is_relation or not field.concrete:
+        raise NotCompilable(source)
+    return field.name
+
+
+def compile_simple_fields(model, fields, prefix=''):
+    """Возвращает (имя, колонка, to_representation) простых полей."""
+    result = []
+    for name, field in fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, (serializers.BaseSerializer,
+                              serializers.RelatedField,
+                              serializers.ManyRelatedField,
+                              serializers.SerializerMethodField)):
+            raise NotCompilable(name)
+        result.append((
+            name,
+            prefix + get_column(model, field.source),
+            field.to_representation,
+        ))
+    return result
+
+
+def build_item(row, simple_fields):
+    """Словарь простых полей одной строки values()."""
+    item = {}
+    for name, column, to_representation in simple_fields:
+        value = row[column]
+        item[name] = None if value is None else to_representation(value)
+    return item
+
+
+class ManyToManyMapper:
+    """Вложенный сериализатор many=True поверх ManyToManyField.
+
+    Связанные объекты всех строк читаются одним запросом к промежуточной
+    таблице в порядке Meta.ordering связанной модели.
+    """
+
+    def __init__(self, model, field):
+        try:
+            m2m = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            raise NotCompilable(field.source)
+        if not m2m.many_to_many or not m2m.concrete:
+            raise NotCompilable(field.source)
+        self.through = m2m.remote_field.through
+        self.source_column = f'{m2m.m2m_field_name()}_id'
+        target = m2m.m2m_reverse_field_name()
+        related_model = m2m.related_model
+        self.fields = compile_simple_fields(
+            related_model, field.child.fields, prefix=f'{target}__'
+        )
+        self.ordering = [
+            (
+                f'-{target}__{order[1:]}' if order.startswith('-')
+                else f'{target}__{order}'
+            )
+            for order in related_model._meta.ordering
+        ] + [f'{target}__pk']
+
+    def fetch(self, ids):
+        """Возвращает {id строки: [представления связанных объектов]}."""
+        result = defaultdict(list)
+        rows = self.through.objects.filter(
+            **{f'{self.source_column}__in': ids}
+        ).order_by(*self.ordering).values(
+            self.source_column, *(column for _, column, _ in self.fields)
+        )
+        for row in rows:
+            result[row[self.source_column]].append(
+                build_item(row, self.fields)
+            )
+        return result
+
+
+class ValuesMapper:
+    """Представление строк values() по полям сериализатора модели.
+
+    Поддерживаются поля модели без связи, SlugRelatedField по внешнему
+    ключу, вложенный сериализатор внешнего ключа и вложенный
+    сериализатор many=True по ManyToManyField. Простые поля выводятся
+    их же to_representation, поэтому результат совпадает с .data
+    сериализатора. Для остальных полей конструктор бросает NotCompilable.
+    """
+
+    def __init__(self, serializer, field_names):
+        model = serializer.Meta.model
+        self.pk_column = model._meta.pk.name
+        self.columns = {self.pk_column}
+        # Шаги в порядке полей: (имя, вид, данные).
+        self.steps = []
+        self.many = {}
+        for name in field_names:
+            field = serializer.fields[name]
+            if field.write_only:
+                continue
+            if isinstance(field, serializers.ListSerializer):
+                self.many[name] = ManyToManyMapper(model, field)
+                self.steps.append((name, 'many', None))
+            elif isinstance(field, serializers.ModelSerializer):
+                relation = self.get_foreign_key(model, field.source)
+                nested = compile_simple_fields(
+                    relation.related_model, field.fields,
+                    prefix=f'{relation.name}__'
+                )
+                self.columns.add(relation.name)
+                self.columns.update(column for _, column, _ in nested)
+                self.steps.append((name, 'nested', (relation.name, nested)))
+            elif isinstance(field, SlugRelatedField):
+                relation = self.get_foreign_key(model, field.source)
+                column = f'{relation.name}__{field.slug_field}'
+                self.columns.add(column)
+                self.steps.append((name, 'column', column))
+            else:
+                [simple] = compile_simple_fields(model, {name: field})
+                self.columns.add(simple[1])
+                self.steps.append((name, 'simple', simple[1:]))
+
+    @staticmethod
+    def get_foreign_key(model, source):
+        try:
+            relation = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise NotCompilable(source)
+        if not (relation.many_to_one or relation.one_to_one):
+            raise NotCompilable(source)
+        return relation
+
+    def represent(self, rows):
+        """Представления строк в порядке полей сериализатора."""
+        related = {
+            name: mapper.fetch([row[self.pk_column] for row in rows])
+            for name, mapper in self.many.items()
+        }
+        result = []
+        for row in rows:
+            item = {}
+            for name, kind, payload in self.steps:
+                if kind == 'simple':
+                    column, to_representation = payload
+                    value = row[column]
+                    item[name] = (
+                        None if value is None else to_representation(value)
+                    )
+                elif kind == 'column':
+                    item[name] = row[payload]
+                elif kind == 'nested':
+                    relation, nested = payload
+                    item[name] = (
+                        None if row[relation] is None
+                        else build_item(row, nested)
+                    )
+                else:
+                    item[name] = related[name].get(row[self.pk_column], [])
+            result.append(item)
+        return result
+
+
+_mappers = {}
+
+
+def get_values_mapper(serializer_class, field_names):
+    """ValuesMapper для полей field_names сериализатора или None.
+
+    Разбор полей выполняется один раз на класс и набор полей; поля
+    берутся у сериализатора без контекста, чтобы не держать запрос.
+    """
+    key = (serializer_class, field_names)
+    if key not in _mappers:
+        try:
+            _mappers[key] = ValuesMapper(serializer_class(), field_names)
+        except NotCompilable:
+            _mappers[key] = None
+    return _mappers[key]
+
+
+class ValuesSerializer:
+    """Замена сериализатора на чтение для строк values()."""
+
+    def __init__(self, mapper, instance, many=False):
+        self.mapper = mapper
+        self.instance = instance
+        self.many = many
+
+    @property
+    def data(self):
+        if self.many:
+            return self.mapper.represent(list(self.instance))
+        return self.mapper.represent([self.instance])[0]
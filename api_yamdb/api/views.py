@@ -1,18 +1,30 @@
-from django.db.models import Avg
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, viewsets
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from api_yamdb.instrumentation import metrics_store
+from api_yamdb.throttling import UserWriteRateThrottle
+from api.cache import COMMENTS_SCOPE, REVIEWS_SCOPE, TITLES_SCOPE
+from api.export import EXPORT_DATASETS, EXPORTERS
 from api.filter import TitleFilter
-from api.mixins import ListCreateDestroyViewSet, UpdateNotAllowedMixin
+from api.mixins import (
+    ConditionalGetMixin, EagerLoadingViewSetMixin, ListCreateDestroyViewSet,
+    UpdateNotAllowedMixin, ValuesReadViewSetMixin
+)
+from api.pagination import KeysetOrPageNumberPagination
 from api.permissions import IsAdminOrReadOnly, IsOwnerOrAdminOrReadOnly
 from api.serializers import (
     CategorySerializer, CommentSerializer,
     GenreSerializer, ReviewSerializer,
     TitleSaveSerializer, TitleSerializer
 )
-from reviews.models import Category, Genre, Review, Title
+from reviews.models import Category, Comment, Genre, Review, Title
+from users.permission import IsAdmin
 
 
 class CategoryViewSet(ListCreateDestroyViewSet):
@@ -29,16 +41,19 @@ class GenreViewSet(ListCreateDestroyViewSet):
     serializer_class = GenreSerializer
 
 
-class TitleViewSet(UpdateNotAllowedMixin, viewsets.ModelViewSet):
+class TitleViewSet(ConditionalGetMixin, ValuesReadViewSetMixin,
+                   EagerLoadingViewSetMixin, UpdateNotAllowedMixin,
+                   viewsets.ModelViewSet):
     """Вьюсет Произведения"""
 
-    queryset = Title.objects.all().annotate(
-        rating=Avg('reviews__score')
-    ).order_by('-rating')
+    queryset = Title.objects.all().order_by('-rating')
     permission_classes = (IsAdminOrReadOnly,)
     filter_backends = (DjangoFilterBackend, filters.OrderingFilter)
     filterset_class = TitleFilter
     ordering_fields = ('rating',)
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('-rating', 'id')
+    version_scope = TITLES_SCOPE
 
     def get_serializer_class(self):
         """Возвращает класс сериализатора в зависимости от действия."""
@@ -47,37 +62,75 @@ class TitleViewSet(UpdateNotAllowedMixin, viewsets.ModelViewSet):
         return TitleSaveSerializer
 
 
-class ReviewViewSet(UpdateNotAllowedMixin, viewsets.ModelViewSet):
+class ReviewViewSet(ConditionalGetMixin, ValuesReadViewSetMixin,
+                    EagerLoadingViewSetMixin, UpdateNotAllowedMixin,
+                    viewsets.ModelViewSet):
     """Вьюсет Ревью"""
 
     serializer_class = ReviewSerializer
     permission_classes = (IsOwnerOrAdminOrReadOnly,
                           IsAuthenticatedOrReadOnly,)
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('pub_date', 'id')
+    throttle_classes = (UserWriteRateThrottle,)
+    throttle_scope = 'reviews'
+
+    def get_version_scope(self):
+        """Отзывы версионируются по произведению."""
+        return REVIEWS_SCOPE.format(title_id=self.kwargs.get('title_id'))
 
     def get_queryset(self):
-        """Возвращает queryset для получения ревью."""
-        return self.get_title().reviews.all()
+        """Возвращает queryset для получения ревью.
+
+        Для списка произведение проверяется отдельно, чтобы вернуть 404;
+        для одного отзыва достаточно условия на title_id в его выборке.
+        """
+        if self.action == 'list':
+            return self.get_title().reviews.all()
+        return Review.objects.filter(title_id=self.kwargs.get('title_id'))
 
     def perform_create(self, serializer):
         """Создает новое ревью."""
         serializer.save(author=self.request.user, title=self.get_title())
 
     def get_title(self):
-        """Получает объект Title по title_id."""
-        title_id = self.kwargs.get('title_id')
-        return get_object_or_404(Title, pk=title_id)
+        """Получает объект Title по title_id один раз за запрос."""
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, pk=self.kwargs.get('title_id')
+            )
+        return self._title
 
 
-class CommentViewSet(UpdateNotAllowedMixin, viewsets.ModelViewSet):
+class CommentViewSet(ConditionalGetMixin, ValuesReadViewSetMixin,
+                     EagerLoadingViewSetMixin, UpdateNotAllowedMixin,
+                     viewsets.ModelViewSet):
     """Вьюсет Комментария"""
 
     permission_classes = (IsOwnerOrAdminOrReadOnly,
                           IsAuthenticatedOrReadOnly,)
     serializer_class = CommentSerializer
+    pagination_class = KeysetOrPageNumberPagination
+    keyset_ordering = ('pub_date', 'id')
+    throttle_classes = (UserWriteRateThrottle,)
+    throttle_scope = 'comments'
+
+    def get_version_scope(self):
+        """Комментарии версионируются по отзыву."""
+        return COMMENTS_SCOPE.format(review_id=self.kwargs.get('review_id'))
 
     def get_queryset(self):
-        """Возвращает queryset для получения комментариев."""
-        return self.get_review().comments.all()
+        """Возвращает queryset для получения комментариев.
+
+        Для списка отзыв проверяется отдельно, чтобы вернуть 404;
+        для одного комментария иерархия проверяется в его же выборке.
+        """
+        if self.action == 'list':
+            return self.get_review().comments.all()
+        return Comment.objects.filter(
+            review_id=self.kwargs.get('review_id'),
+            review__title_id=self.kwargs.get('title_id')
+        )
 
     def perform_create(self, serializer):
         """Создает новый комментарий."""
@@ -87,8 +140,50 @@ class CommentViewSet(UpdateNotAllowedMixin, viewsets.ModelViewSet):
         )
 
     def get_review(self):
-        """Получает объект ревью."""
-        return get_object_or_404(
-            Review, pk=self.kwargs.get('review_id'),
-            title__id=self.kwargs.get('title_id')
+        """Получает объект ревью один раз за запрос.
+
+        Принадлежность отзыва произведению проверяется тем же запросом.
+        """
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review, pk=self.kwargs.get('review_id'),
+                title_id=self.kwargs.get('title_id')
+            )
+        return self._review
+
+
+class ExportView(APIView):
+    """Потоковая выгрузка набора данных в NDJSON или CSV."""
+
+    permission_classes = (IsAdmin,)
+    output_query_param = 'output'
+
+    def get(self, request, dataset):
+        """Отдает набор данных потоком, не загружая его в память."""
+        if dataset not in EXPORT_DATASETS:
+            raise NotFound(detail=f'Набора данных {dataset} не существует')
+        output = request.query_params.get(self.output_query_param, 'ndjson')
+        if output not in EXPORTERS:
+            raise ValidationError({
+                self.output_query_param: [
+                    f'Допустимые форматы: {", ".join(EXPORTERS)}'
+                ]
+            })
+        exporter, content_type, extension = EXPORTERS[output]
+        response = StreamingHttpResponse(
+            exporter(dataset), content_type=content_type
         )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{dataset}.{extension}"'
+        )
+        return response
+
+
+class MetricsView(APIView):
+    """Статистика запросов по эндпоинтам в текущем процессе."""
+
+    permission_classes = (IsAdmin,)
+
+    def get(self, request):
+        """Отдает перцентили времени и количества запросов к БД."""
+        return Response(metrics_store.get_stats())
@@ -0,0 +1,105 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSED_KEY = 'compressed:{encoding}:{etag}'
+
+
+def compress_brotli(content):
+    return brotli.compress(
+        content, quality=settings.COMPRESSION_BROTLI_QUALITY
+    )
+
+
+# Кодировки в порядке предпочтения; brotli — только если установлен.
+COMPRESSORS = (
+    (('br', compress_brotli),) if brotli is not None else ()
+) + (('gzip', compress_string),)
+
+
+def get_accepted_encodings(request):
+    """Кодировки из Accept-Encoding с ненулевым q."""
+    accepted = set()
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        encoding, _, params = item.strip().partition(';')
+        quality = params.strip().partition('q=')[2]
+        try:
+            if quality and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(encoding.strip().lower())
+    return accepted
+
+
+class CompressionMiddleware:
+    """Сжимает JSON-ответы API в brotli или gzip.
+
+    Сжимаются ответы длиннее COMPRESSION_MIN_SIZE байт с типом из
+    COMPRESSION_CONTENT_TYPES. Сжатое тело ответа с сильным ETag
+    сохраняется в кэше по ETag, поэтому повторные ответы той же версии
+    данных не сжимаются заново. Время сжатия попадает в замер
+    InstrumentationMiddleware, поэтому этот middleware должен стоять
+    после него.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.cache = caches[settings.COMPRESSION_CACHE_ALIAS]
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not self.should_compress(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        accepted = get_accepted_encodings(request)
+        for encoding, compress in COMPRESSORS:
+            if encoding in accepted:
+                break
+        else:
+            return response
+
+        started = time.perf_counter()
+        etag = response.get('ETag', '')
+        key = None
+        compressed = None
+        if etag.startswith('"'):
+            key = COMPRESSED_KEY.format(encoding=encoding, etag=etag)
+            compressed = self.cache.get(key)
+        if compressed is None:
+            compressed = compress(response.content)
+            if key is not None:
+                self.cache.set(
+                    key, compressed, settings.COMPRESSION_CACHE_TIMEOUT
+                )
+        metrics = getattr(request, '_metrics', None)
+        if metrics is not None:
+            metrics.compress += time.perf_counter() - started
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        if etag.startswith('"'):
+            response['ETag'] = f'W/{etag}'
+        return response
+
+    @staticmethod
+    def should_compress(response):
+        return (
+            not response.streaming
+            and response.status_code == 200
+            and not response.has_header('Content-Encoding')
+            and response.get('Content-Type', '').split(';')[0].strip()
+            in settings.COMPRESSION_CONTENT_TYPES
+            and len(response.content) >= settings.COMPRESSION_MIN_SIZE
+        )
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def set_sqlite_pragmas(sender, connection, **kwargs):
+    """Применяет SQLITE_PRAGMAS к новому соединению SQLite."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+@receiver(request_started)
+def check_persistent_connections(**kwargs):
+    """Закрывает постоянные соединения, которые перестали работать.
+
+    Замена CONN_HEALTH_CHECKS из Django 4.1: без проверки первый запрос
+    после разрыва соединения сервером БД завершился бы ошибкой.
+    Закрытое соединение откроется заново при первом обращении.
+    """
+    for connection in connections.all():
+        if (
+            connection.connection is None
+            or not connection.settings_dict.get('CONN_HEALTH_CHECKS')
+            or connection.settings_dict.get('CONN_MAX_AGE') == 0
+            or connection.in_atomic_block
+        ):
+            continue
+        if not connection.is_usable():
+            connection.close()
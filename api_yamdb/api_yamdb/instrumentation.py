@@ -0,0 +1,162 @@
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from api_yamdb.prometheus import (
+    OTHER_LABEL, get_method_label, observe_request
+)
+
+# Поля замера: время запроса, время в БД, время рендеринга и сжатия
+# ответа (в секундах) и количество запросов к БД.
+SAMPLE_FIELDS = ('total', 'db', 'serialize', 'compress', 'queries')
+PERCENTILES = (50, 95, 99)
+
+
+class RequestMetrics:
+    """Счетчики одного запроса.
+
+    Экземпляр передается в connection.execute_wrapper и считает
+    запросы к БД и время их выполнения.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.compress = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+    def get_sample(self):
+        """Возвращает замер в порядке SAMPLE_FIELDS."""
+        return (
+            time.perf_counter() - self.started,
+            self.db,
+            self.serialize,
+            self.compress,
+            self.queries,
+        )
+
+    def get_server_timing(self, total):
+        """Значение заголовка Server-Timing в миллисекундах."""
+        return (
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries", '
+            f'serialize;dur={self.serialize * 1000:.2f}, '
+            f'compress;dur={self.compress * 1000:.2f}, '
+            f'total;dur={total * 1000:.2f}'
+        )
+
+
+def count_cache_lookup(request, hit):
+    """Учитывает обращение к кэшу в замере текущего запроса."""
+    metrics = getattr(request, '_metrics', None)
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+def percentile(values, percent):
+    """Перцентиль по методу ближайшего ранга для отсортированных values."""
+    index = max(0, -(-len(values) * percent // 100) - 1)
+    return values[index]
+
+
+class MetricsStore:
+    """Последние замеры по эндпоинтам в памяти процесса.
+
+    На каждый эндпоинт хранится не больше INSTRUMENTATION_SAMPLE_SIZE
+    замеров; deque.append атомарен, поэтому блокировки не нужны.
+    """
+
+    def __init__(self, sample_size):
+        self.samples = defaultdict(lambda: deque(maxlen=sample_size))
+
+    def add(self, endpoint, sample):
+        self.samples[endpoint].append(sample)
+
+    def clear(self):
+        self.samples.clear()
+
+    def get_stats(self):
+        """Количество замеров и перцентили каждого поля по эндпоинтам."""
+        stats = {}
+        for endpoint, samples in sorted(self.samples.copy().items()):
+            samples = list(samples)
+            endpoint_stats = {'count': len(samples)}
+            for position, field in enumerate(SAMPLE_FIELDS):
+                values = sorted(sample[position] for sample in samples)
+                scale = 1 if field == 'queries' else 1000
+                name = field if field == 'queries' else f'{field}_ms'
+                endpoint_stats[name] = {
+                    f'p{percent}': round(
+                        percentile(values, percent) * scale, 3
+                    )
+                    for percent in PERCENTILES
+                }
+                endpoint_stats[name]['max'] = round(values[-1] * scale, 3)
+            stats[endpoint] = endpoint_stats
+        return stats
+
+
+metrics_store = MetricsStore(settings.INSTRUMENTATION_SAMPLE_SIZE)
+
+
+def get_endpoint_name(request):
+    """Имя эндпоинта: метод и имя маршрута, например GET api:titles-list.
+
+    Нестандартные методы и адреса без маршрута сводятся к other,
+    чтобы клиенты не могли заводить новые эндпоинты в хранилище.
+    """
+    match = request.resolver_match
+    view_name = match.view_name if match else OTHER_LABEL
+    return f'{get_method_label(request)} {view_name}'
+
+
+class InstrumentationMiddleware:
+    """Считает запросы к БД, время БД, рендеринга и всего запроса.
+
+    Замер добавляется в заголовок Server-Timing, в metrics_store
+    и в метрики Prometheus.
+    Должен стоять первым в MIDDLEWARE, чтобы учитывать остальные.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = request._metrics = RequestMetrics()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            response = self.get_response(request)
+        sample = metrics.get_sample()
+        response['Server-Timing'] = metrics.get_server_timing(sample[0])
+        metrics_store.add(get_endpoint_name(request), sample)
+        observe_request(request, response, metrics, sample[0])
+        return response
+
+    def process_template_response(self, request, response):
+        """Засекает рендеринг ответа, который идет после этого хука."""
+        metrics = request._metrics
+        started = time.perf_counter()
+
+        def stop_timer(response):
+            metrics.serialize += time.perf_counter() - started
+
+        response.add_post_render_callback(stop_timer)
+        return response
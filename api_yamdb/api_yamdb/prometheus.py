@@ -0,0 +1,113 @@
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram,
+    generate_latest, multiprocess
+)
+
+# Фиксированные границы корзин: наблюдение — один bisect и инкремент
+# счетчика, а гистограммы разных процессов можно просто складывать.
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+# Метки ограничены известными значениями: произвольные методы
+# и адреса от клиентов сводятся к OTHER_LABEL и не создают новых рядов.
+METRIC_METHODS = frozenset((
+    'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'
+))
+OTHER_LABEL = 'other'
+
+REQUEST_DURATION = Histogram(
+    'yamdb_request_duration_seconds',
+    'Время обработки запроса.',
+    ('route', 'method'),
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS = Counter(
+    'yamdb_requests',
+    'Количество запросов по статусам ответа.',
+    ('route', 'method', 'status'),
+)
+DB_QUERIES = Histogram(
+    'yamdb_db_queries_per_request',
+    'Количество запросов к БД на один запрос.',
+    ('route', 'method'),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'yamdb_db_duration_seconds',
+    'Время запросов к БД на один запрос.',
+    ('route', 'method'),
+    buckets=LATENCY_BUCKETS,
+)
+COMPRESS_DURATION = Histogram(
+    'yamdb_compress_duration_seconds',
+    'Время сжатия ответа на один запрос.',
+    ('route', 'method'),
+    buckets=LATENCY_BUCKETS,
+)
+LIST_CACHE_LOOKUPS = Counter(
+    'yamdb_list_cache_lookups',
+    'Обращения к кэшу списков по результату (hit или miss).',
+    ('route', 'result'),
+)
+
+
+def get_route_name(request):
+    """Имя маршрута DRF, например titles-list."""
+    match = request.resolver_match
+    return match.url_name if match and match.url_name else OTHER_LABEL
+
+
+def get_method_label(request):
+    """Метод запроса; нестандартные методы сводятся к other."""
+    return request.method if request.method in METRIC_METHODS else (
+        OTHER_LABEL
+    )
+
+
+def observe_request(request, response, metrics, total):
+    """Записывает замер запроса в метрики Prometheus."""
+    route = get_route_name(request)
+    method = get_method_label(request)
+    REQUEST_DURATION.labels(route, method).observe(total)
+    REQUESTS.labels(route, method, response.status_code).inc()
+    DB_QUERIES.labels(route, method).observe(metrics.queries)
+    DB_DURATION.labels(route, method).observe(metrics.db)
+    if metrics.compress:
+        COMPRESS_DURATION.labels(route, method).observe(metrics.compress)
+    for result, amount in (
+        ('hit', metrics.cache_hits), ('miss', metrics.cache_misses)
+    ):
+        if amount:
+            LIST_CACHE_LOOKUPS.labels(route, result).inc(amount)
+
+
+def get_registry():
+    """Реестр метрик процесса или всех воркеров.
+
+    Если задана переменная окружения PROMETHEUS_MULTIPROC_DIR,
+    prometheus_client пишет значения каждого воркера в mmap-файлы этого
+    каталога, а отдача собирает и суммирует их.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    """Отдает метрики в текстовом формате Prometheus.
+
+    Доступно только с адресов из PROMETHEUS_ALLOWED_IPS.
+    """
+    if request.META.get('REMOTE_ADDR') not in settings.PROMETHEUS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
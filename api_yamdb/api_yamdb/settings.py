@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -29,6 +30,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api_yamdb.instrumentation.InstrumentationMiddleware',
+    'api_yamdb.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -62,14 +65,122 @@ WSGI_APPLICATION = 'api_yamdb.wsgi.application'
 
 # Database
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# По умолчанию SQLite; DB_ENGINE=postgresql включает PostgreSQL.
+# Соединения живут DB_CONN_MAX_AGE секунд и проверяются перед запросом
+# (CONN_HEALTH_CHECKS обрабатывает api_yamdb.database). При DB_POOL_SIZE > 0
+# соединения PostgreSQL берутся из пула django-db-connection-pool.
+DB_ENGINE = os.getenv('DB_ENGINE', 'sqlite')
+
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 0))
+
+if DB_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv('DB_NAME', 'api_yamdb'),
+            'USER': os.getenv('DB_USER', 'postgres'),
+            'PASSWORD': os.getenv('DB_PASSWORD', ''),
+            'HOST': os.getenv('DB_HOST', 'localhost'),
+            'PORT': os.getenv('DB_PORT', '5432'),
+        }
+    }
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        }
     }
+else:
+    raise ValueError(f'Неизвестный DB_ENGINE: {DB_ENGINE}')
+
+if DB_ENGINE == 'postgresql' and DB_POOL_SIZE > 0:
+    # Пул сам возвращает и проверяет соединения, поэтому Django
+    # закрывает соединение (отдает в пул) после каждого запроса.
+    DATABASES['default'].update(
+        ENGINE='dj_db_conn_pool.backends.postgresql',
+        CONN_MAX_AGE=0,
+        CONN_HEALTH_CHECKS=False,
+        POOL_OPTIONS={
+            'POOL_SIZE': DB_POOL_SIZE,
+            'MAX_OVERFLOW': int(os.getenv('DB_POOL_MAX_OVERFLOW', 10)),
+            'RECYCLE': int(os.getenv('DB_POOL_RECYCLE', 30 * 60)),
+        },
+    )
+else:
+    DATABASES['default'].update(
+        CONN_MAX_AGE=int(os.getenv('DB_CONN_MAX_AGE', 60)),
+        CONN_HEALTH_CHECKS=os.getenv('DB_CONN_HEALTH_CHECKS', '1') == '1',
+    )
+
+# PRAGMA каждого нового соединения SQLite: WAL позволяет читать во время
+# записи, а busy_timeout (мс) ждет блокировку вместо ошибки.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+    'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
 }
 
 
+# Cache
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'local',
+        'TIMEOUT': 5,
+    },
+    # Корзины ограничения частоты отдельно от кэша списков, чтобы
+    # вытеснение страниц не сбрасывало лимиты. При нескольких процессах
+    # нужен общий бэкенд (Redis, Memcached), иначе лимит считается
+    # в каждом процессе отдельно.
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+# Кэш ответов списков и меток версий наборов данных, по которым
+# сбрасываются кэш и ETag. При нескольких процессах нужен общий бэкенд
+# (Redis, Memcached), иначе изменение, сделанное в одном процессе,
+# не видно в остальных до истечения API_LIST_CACHE_TIMEOUT.
+API_LIST_CACHE_ALIAS = 'default'
+
+API_LIST_CACHE_TIMEOUT = 60 * 60
+
+# Сжатие JSON-ответов (brotli, если установлен, иначе gzip). Сжатые
+# ответы с ETag хранятся в кэше COMPRESSION_CACHE_ALIAS.
+COMPRESSION_MIN_SIZE = 1024
+
+COMPRESSION_CONTENT_TYPES = ('application/json',)
+
+COMPRESSION_BROTLI_QUALITY = 5
+
+COMPRESSION_CACHE_ALIAS = 'default'
+
+COMPRESSION_CACHE_TIMEOUT = 60 * 60
+
+# Чтение list и retrieve произведений, отзывов и комментариев через
+# values() без создания объектов моделей.
+API_VALUES_READ_PATH = True
+
+# Сколько последних замеров хранить на эндпоинт для /api/v1/_metrics/.
+INSTRUMENTATION_SAMPLE_SIZE = 1000
+
+# Адреса (REMOTE_ADDR), с которых доступна отдача метрик /metrics/,
+# через запятую.
+PROMETHEUS_ALLOWED_IPS = tuple(
+    ip.strip() for ip in os.getenv(
+        'PROMETHEUS_ALLOWED_IPS', '127.0.0.1,::1'
+    ).split(',') if ip.strip()
+)
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -99,14 +210,34 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PAGINATION_CLASS': (
         'rest_framework.pagination.PageNumberPagination'
     ),
     'PAGE_SIZE': 10,
+    'DEFAULT_RENDERER_CLASSES': (
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'api.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'auth': os.getenv('THROTTLE_AUTH_RATE', '30/min'),
+        'reviews': os.getenv('THROTTLE_REVIEWS_RATE', '30/min'),
+        'comments': os.getenv('THROTTLE_COMMENTS_RATE', '60/min'),
+    },
+    # Число доверенных прокси перед приложением. При 0 клиент
+    # определяется по REMOTE_ADDR, а X-Forwarded-For игнорируется, иначе
+    # ограничения по IP обходятся подменой заголовка.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', 0)),
 }
 
+THROTTLE_CACHE_ALIAS = 'throttle'
+
 
 # EMAIL
 
@@ -114,6 +245,19 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 
+# Письма через очередь: SignUp только сохраняет письмо, отправляет
+# его команда send_queued_emails. Очередь включается явно
+# (EMAIL_OUTBOX_ENABLED=1): по умолчанию письмо отправляется прямо в
+# запросе, как ожидают клиенты API. Со включённой очередью команда
+# send_queued_emails --loop обязательна, без неё письма не уйдут.
+EMAIL_OUTBOX_ENABLED = os.getenv('EMAIL_OUTBOX_ENABLED', '0') == '1'
+
+EMAIL_OUTBOX_BATCH_SIZE = 100
+
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+
+EMAIL_OUTBOX_RETRY_DELAY = 60
+
 # SIMPLE_JWT
 
 SIMPLE_JWT = {
@@ -121,6 +265,29 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',)
 }
 
+# Снимки пользователей для JWT-аутентификации. Сигналы сбрасывают снимок
+# только в кэшах процесса, обработавшего изменение: с локальным кэшем
+# (LocMemCache) пониженный в роли или отключенный пользователь сохраняет
+# права в остальных процессах до истечения JWT_USER_CACHE_TIMEOUT.
+# Поэтому по умолчанию снимок живет столько же, сколько в кэше `local`;
+# увеличивать время стоит только с общим бэкендом (Redis, Memcached).
+JWT_USER_CACHE_ALIAS = 'default'
+
+JWT_USER_CACHE_TIMEOUT = int(os.getenv('JWT_USER_CACHE_TIMEOUT', 5))
+
+JWT_USER_LOCAL_CACHE_ALIAS = 'local'
+
+# Сколько секунд помнить имена, не найденные при выдаче токена (0 — не
+# помнить). Регистрация забывает имя только в кэше своего процесса,
+# поэтому включать стоит с общим бэкендом (Redis, Memcached), иначе
+# другие процессы отвечают 404 на запрос токена только что
+# зарегистрированного пользователя до истечения этого времени.
+TOKEN_UNKNOWN_USERNAME_CACHE_ALIAS = 'default'
+
+TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT = int(
+    os.getenv('TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT', 0)
+)
+
 # Internationalization
 
 LANGUAGE_CODE = 'ru'
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class TokenBucketRateThrottle(SimpleRateThrottle):
+    """Ограничение частоты запросов по алгоритму token bucket.
+
+    Скорость 'N/период' задает емкость корзины N и пополнение N
+    токенов за период. В кэше хранится только пара (токены, время),
+    а не история запросов, как у SimpleRateThrottle.
+    """
+
+    cache = caches[settings.THROTTLE_CACHE_ALIAS]
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        refill_rate = self.num_requests / self.duration
+        tokens, updated_at = self.cache.get(
+            self.key, (self.num_requests, now)
+        )
+        tokens = min(
+            self.num_requests, tokens + (now - updated_at) * refill_rate
+        )
+        if tokens < 1:
+            self.wait_seconds = (1 - tokens) / refill_rate
+            return False
+        self.cache.set(self.key, (tokens - 1, now), self.duration)
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class AuthRateThrottle(TokenBucketRateThrottle):
+    """Ограничение запросов к регистрации и выдаче токена по IP."""
+
+    scope = 'auth'
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request),
+        }
+
+
+class UserWriteRateThrottle(TokenBucketRateThrottle):
+    """Ограничение запросов на запись по пользователю.
+
+    Область задается атрибутом throttle_scope вьюсета, чтение
+    не ограничивается.
+    """
+
+    def __init__(self):
+        # Скорость зависит от вьюсета и определяется в allow_request.
+        pass
+
+    def allow_request(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        self.scope = getattr(view, 'throttle_scope', None)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
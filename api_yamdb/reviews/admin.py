@@ -54,7 +54,9 @@ class TitleAdmin(admin.ModelAdmin):
         'year',
         'description',
         'category',
+        'rating',
     )
+    readonly_fields = ('rating_sum', 'rating_count', 'rating')
 
     list_editable = ('name', 'description', 'category', 'year')
     search_fields = ('name', 'year', 'genre', 'category')
@@ -1,3 +1,5 @@
 MAX_TITLE_LENGTH = 30
 MAX_SLUG_LENGTH = 50
 MAX_TEXT_LENGTH = 256
+RATING_FIELDS = ('rating_sum', 'rating_count', 'rating')
+TITLE_SEARCH_TABLE = 'reviews_title_fts'
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reviews.models import Title
+
+
+class Command(BaseCommand):
+    """Пересчитывает хранимый рейтинг произведений по отзывам."""
+
+    help = 'Пересчитывает rating_sum, rating_count и rating произведений.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'title_ids',
+            nargs='*',
+            type=int,
+            help='id произведений; по умолчанию пересчитываются все.'
+        )
+
+    def handle(self, *args, **options):
+        titles = Title.objects.all()
+        if options['title_ids']:
+            titles = titles.filter(pk__in=options['title_ids'])
+        with transaction.atomic():
+            updated = titles.recalculate_rating()
+        self.stdout.write(
+            self.style.SUCCESS(f'Пересчитан рейтинг произведений: {updated}')
+        )
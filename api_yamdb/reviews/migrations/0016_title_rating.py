@@ -0,0 +1,43 @@
+# Generated by Django 3.2 on 2026-10-18 02:36
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def fill_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    for title in Title.objects.annotate(
+        total=Sum('reviews__score'), amount=Count('reviews')
+    ).iterator():
+        title.rating_sum = title.total or 0
+        title.rating_count = title.amount
+        title.rating = (
+            title.rating_sum / title.amount if title.amount else None
+        )
+        title.save(update_fields=('rating_sum', 'rating_count', 'rating'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0015_alter_title_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество оценок'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Сумма оценок'),
+        ),
+        migrations.RunPython(fill_rating, migrations.RunPython.noop),
+    ]
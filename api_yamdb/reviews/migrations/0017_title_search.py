@@ -0,0 +1,63 @@
+from django.db import migrations
+
+SQLITE_FORWARD = (
+    "CREATE VIRTUAL TABLE reviews_title_fts USING fts5("
+    "name, content='reviews_title', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER reviews_title_fts_insert AFTER INSERT ON reviews_title "
+    "BEGIN "
+    "INSERT INTO reviews_title_fts(rowid, name) VALUES (new.id, new.name); "
+    "END",
+    "CREATE TRIGGER reviews_title_fts_delete AFTER DELETE ON reviews_title "
+    "BEGIN "
+    "INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    "END",
+    "CREATE TRIGGER reviews_title_fts_update AFTER UPDATE OF name "
+    "ON reviews_title BEGIN "
+    "INSERT INTO reviews_title_fts(reviews_title_fts, rowid, name) "
+    "VALUES ('delete', old.id, old.name); "
+    "INSERT INTO reviews_title_fts(rowid, name) VALUES (new.id, new.name); "
+    "END",
+    "INSERT INTO reviews_title_fts(reviews_title_fts) VALUES ('rebuild')",
+)
+SQLITE_BACKWARD = (
+    'DROP TRIGGER IF EXISTS reviews_title_fts_update',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_delete',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_insert',
+    'DROP TABLE IF EXISTS reviews_title_fts',
+)
+POSTGRESQL_FORWARD = (
+    "CREATE INDEX reviews_title_name_fts ON reviews_title "
+    "USING gin (to_tsvector('simple', name))",
+)
+POSTGRESQL_BACKWARD = (
+    'DROP INDEX IF EXISTS reviews_title_name_fts',
+)
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0016_title_rating'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql({
+                'sqlite': SQLITE_FORWARD,
+                'postgresql': POSTGRESQL_FORWARD,
+            }),
+            run_vendor_sql({
+                'sqlite': SQLITE_BACKWARD,
+                'postgresql': POSTGRESQL_BACKWARD,
+            }),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2 on 2026-10-18 03:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0018_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VersionStamp',
+            fields=[
+                ('scope', models.CharField(max_length=256, primary_key=True, serialize=False, verbose_name='Набор данных')),
+                ('version', models.PositiveBigIntegerField(default=0, verbose_name='Версия')),
+                ('modified', models.DateTimeField(verbose_name='Время изменения')),
+            ],
+            options={
+                'verbose_name': 'Метка версии',
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 3.2 on 2026-10-18 03:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0019_version_stamp'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='VersionStamp',
+        ),
+    ]
@@ -1,15 +1,35 @@
 import datetime as dt
+import re
+from functools import reduce
+from operator import and_
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import (
+    F, FloatField, OuterRef, Q, Subquery, Sum, Count
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast, Coalesce, NullIf
+from django.dispatch import Signal
 
-from .constants import MAX_TEXT_LENGTH, MAX_TITLE_LENGTH, MAX_SLUG_LENGTH
+from .constants import (
+    MAX_SLUG_LENGTH, MAX_TEXT_LENGTH, MAX_TITLE_LENGTH, RATING_FIELDS,
+    TITLE_SEARCH_TABLE
+)
 
 
 User = get_user_model()
 
+SEARCH_WORD_RE = re.compile(r'[^\W_]+')
+
+# Отправляются после удаления отзывов (аргументы review_ids и title_ids)
+# и комментариев (review_ids) вместо post_delete: у моделей без
+# получателей post_delete каскадное удаление не загружает объекты.
+reviews_deleted = Signal()
+comments_deleted = Signal()
+
 
 class CommonFields(models.Model):
     """Абстрактный класс для общих полей"""
@@ -17,7 +37,8 @@ class CommonFields(models.Model):
     name = models.CharField(
         'Название',
         max_length=MAX_TEXT_LENGTH,
-        default=None
+        default=None,
+        db_index=True
     )
     slug = models.SlugField(
         'slug',
@@ -49,6 +70,92 @@ class Genre(CommonFields):
         verbose_name = 'Жанр'
 
 
+class TitleQuerySet(models.QuerySet):
+    """QuerySet произведений с операциями над хранимым рейтингом."""
+
+    def shift_rating(self, score_delta, count_delta):
+        """Сдвигает сумму и количество оценок одним UPDATE.
+
+        Все выражения SET вычисляются по старым значениям строки,
+        поэтому рейтинг считается от уже сдвинутых суммы и количества.
+        """
+        rating_sum = F('rating_sum') + score_delta
+        rating_count = F('rating_count') + count_delta
+        return self.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating=Cast(rating_sum, FloatField()) / NullIf(rating_count, 0),
+        )
+
+    def recalculate_rating(self):
+        """Пересчитывает рейтинг по таблице отзывов."""
+        reviews = Review.objects.filter(
+            title=OuterRef('pk')
+        ).order_by().values('title')
+        rating_sum = Coalesce(
+            Subquery(reviews.annotate(total=Sum('score')).values('total')),
+            0
+        )
+        rating_count = Coalesce(
+            Subquery(reviews.annotate(total=Count('pk')).values('total')),
+            0
+        )
+        return self.update(
+            rating_sum=rating_sum,
+            rating_count=rating_count,
+            rating=Cast(rating_sum, FloatField()) / NullIf(rating_count, 0),
+        )
+
+    def search(self, query):
+        """Полнотекстовый поиск по названию.
+
+        Каждое слово запроса ищется как начало слова в названии.
+        Найденные произведения аннотируются полем search_rank
+        (чем меньше, тем релевантнее) и упорядочиваются по нему.
+        Используется FTS5 на SQLite и GIN-индекс tsvector на PostgreSQL,
+        на остальных СУБД — поиск по вхождению подстроки.
+        """
+        words = SEARCH_WORD_RE.findall(query.lower())
+        if not words:
+            return self.none()
+        table = self.model._meta.db_table
+        vendor = connections[self.db].vendor
+        if vendor == 'sqlite':
+            match = ' '.join(f'"{word}"*' for word in words)
+            condition = RawSQL(
+                f'SELECT rowid FROM {TITLE_SEARCH_TABLE} '
+                f'WHERE {TITLE_SEARCH_TABLE} MATCH %s',
+                (match,)
+            )
+            rank = RawSQL(
+                f'SELECT bm25({TITLE_SEARCH_TABLE}) FROM {TITLE_SEARCH_TABLE} '
+                f'WHERE {TITLE_SEARCH_TABLE} MATCH %s '
+                f'AND rowid = {table}.id',
+                (match,),
+                output_field=FloatField()
+            )
+        elif vendor == 'postgresql':
+            tsquery = ' & '.join(f'{word}:*' for word in words)
+            condition = RawSQL(
+                f"SELECT id FROM {table} WHERE to_tsvector('simple', name) "
+                f"@@ to_tsquery('simple', %s)",
+                (tsquery,)
+            )
+            rank = RawSQL(
+                f"-ts_rank(to_tsvector('simple', {table}.name), "
+                f"to_tsquery('simple', %s))",
+                (tsquery,),
+                output_field=FloatField()
+            )
+        else:
+            return self.filter(
+                reduce(and_, (Q(name__icontains=word) for word in words))
+            ).order_by('id')
+        return self.filter(id__in=condition).annotate(
+            search_rank=rank
+        ).order_by('search_rank', 'id')
+
+
 class Title(models.Model):
     """Модель произведения"""
 
@@ -75,15 +182,54 @@ class Title(models.Model):
         on_delete=models.SET_NULL,
         blank=True
     )
+    rating_sum = models.PositiveIntegerField(
+        'Сумма оценок',
+        default=0,
+        editable=False,
+    )
+    rating_count = models.PositiveIntegerField(
+        'Количество оценок',
+        default=0,
+        editable=False,
+    )
+    rating = models.FloatField(
+        'Рейтинг',
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )
+
+    objects = TitleQuerySet.as_manager()
 
     class Meta:
         default_related_name = 'titles'
         verbose_name = 'Произведение'
         indexes = [
             models.Index(fields=['year']),
+            models.Index(fields=['category', 'year']),
         ]
         ordering = ('name',)
 
+    def save(self, force_insert=False, force_update=False, using=None,
+             update_fields=None):
+        """Сохраняет произведение, не перезаписывая хранимый рейтинг.
+
+        Рейтинг меняется только атомарными UPDATE из отзывов, поэтому
+        при обновлении произведения его поля не попадают в запрос.
+        """
+        if not self._state.adding and update_fields is None:
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in RATING_FIELDS
+            ]
+        super().save(
+            force_insert=force_insert,
+            force_update=force_update,
+            using=using,
+            update_fields=update_fields,
+        )
+
     def clean(self):
         """Валидатор для поля year"""
         if self.year > dt.datetime.now().year:
@@ -111,6 +257,48 @@ class ComRevFilds(models.Model):
         ordering = ('pub_date',)
 
 
+def send_reviews_deleted(rows):
+    """Отправляет reviews_deleted для пар (id отзыва, id произведения)."""
+    if rows:
+        reviews_deleted.send(
+            sender=Review,
+            review_ids=[review_id for review_id, _ in rows],
+            title_ids=sorted({title_id for _, title_id in rows}),
+        )
+
+
+class ReviewQuerySet(models.QuerySet):
+    """QuerySet отзывов, который поддерживает рейтинг произведений."""
+
+    def remove_from_rating(self):
+        """Убирает оценки отзывов из рейтинга произведений.
+
+        Отзывы блокируются до конца транзакции, затем сумма и количество
+        оценок всех затронутых произведений сдвигаются одним UPDATE.
+        Возвращает пары (id отзыва, id произведения).
+        """
+        rows = list(self.select_for_update().values_list('pk', 'title_id'))
+        if not rows:
+            return rows
+        reviews = self.filter(title=OuterRef('pk')).order_by().values('title')
+        Title.objects.filter(pk__in=self.values('title')).shift_rating(
+            -Subquery(reviews.annotate(total=Sum('score')).values('total')),
+            -Subquery(reviews.annotate(total=Count('pk')).values('total')),
+        )
+        return rows
+
+    def delete(self):
+        """Удаляет отзывы и убирает их оценки из рейтинга."""
+        with transaction.atomic(using=self.db):
+            rows = self.remove_from_rating()
+            deleted = super().delete()
+            send_reviews_deleted(rows)
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
 class Review(ComRevFilds):
     """Модель Ревью"""
 
@@ -122,6 +310,8 @@ class Review(ComRevFilds):
         validators=[MinValueValidator(1), MaxValueValidator(10)]
     )
 
+    objects = ReviewQuerySet.as_manager()
+
     class Meta(ComRevFilds.Meta):
         constraints = (
             models.UniqueConstraint(
@@ -129,12 +319,73 @@ class Review(ComRevFilds):
                 name='unique_review'
             ),
         )
+        indexes = [
+            models.Index(fields=['title', 'pub_date']),
+        ]
         default_related_name = 'reviews'
         verbose_name = 'Ревью'
 
     def __str__(self):
         return f'Отзыв {self.author} на {self.title}'
 
+    def save(self, *args, **kwargs):
+        """Сохраняет отзыв и сдвигает рейтинг произведения.
+
+        Старые оценка и произведение перечитываются с блокировкой строки
+        внутри транзакции, поэтому параллельные изменения одного отзыва
+        сдвигают рейтинг последовательно, а не от одной старой оценки.
+        """
+        score = int(self.score)
+        with transaction.atomic():
+            old_title_id, old_score = (None, None)
+            if not self._state.adding:
+                old_title_id, old_score = (
+                    Review.objects.select_for_update().filter(pk=self.pk)
+                    .values_list('title_id', 'score').first()
+                    or (None, None)
+                )
+            super().save(*args, **kwargs)
+            if old_title_id is None:
+                Title.objects.filter(pk=self.title_id).shift_rating(
+                    score, 1
+                )
+            elif old_title_id != self.title_id:
+                Title.objects.filter(pk=old_title_id).shift_rating(
+                    -old_score, -1
+                )
+                Title.objects.filter(pk=self.title_id).shift_rating(
+                    score, 1
+                )
+            elif old_score != score:
+                Title.objects.filter(pk=self.title_id).shift_rating(
+                    score - old_score, 0
+                )
+
+    def delete(self, *args, **kwargs):
+        """Удаляет отзыв и убирает его оценку из рейтинга произведения."""
+        with transaction.atomic():
+            rows = Review.objects.filter(pk=self.pk).remove_from_rating()
+            deleted = super().delete(*args, **kwargs)
+            send_reviews_deleted(rows)
+        return deleted
+
+
+class CommentQuerySet(models.QuerySet):
+    """QuerySet комментариев, который сообщает об их удалении."""
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            review_ids = list(
+                self.order_by().values_list('review_id', flat=True).distinct()
+            )
+            deleted = super().delete()
+            if review_ids:
+                comments_deleted.send(sender=Comment, review_ids=review_ids)
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class Comment(ComRevFilds):
     """Модель комментария"""
@@ -143,8 +394,13 @@ class Comment(ComRevFilds):
         Review, on_delete=models.CASCADE
     )
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta(ComRevFilds.Meta):
         default_related_name = 'comments'
+        indexes = [
+            models.Index(fields=['review', 'pub_date']),
+        ]
         verbose_name = 'Комментарий'
 
     def __str__(self):
@@ -152,3 +408,8 @@ class Comment(ComRevFilds):
             f'Комментарий {self.author} на отзыв {self.review.author} '
             f'на {self.review.title}'
         )
+
+    def delete(self, *args, **kwargs):
+        deleted = super().delete(*args, **kwargs)
+        comments_deleted.send(sender=Comment, review_ids=[self.review_id])
+        return deleted
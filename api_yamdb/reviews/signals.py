@@ -0,0 +1,15 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import Review, User
+
+
+@receiver(pre_delete, sender=User)
+def remove_author_scores(sender, instance, **kwargs):
+    """Убирает оценки отзывов удаляемого пользователя из рейтинга.
+
+    Отзывы удаляются каскадно без сигналов, поэтому рейтинг всех
+    произведений сдвигается заранее одним UPDATE. При удалении самого
+    произведения рейтинг сдвигать не нужно.
+    """
+    Review.objects.filter(author=instance).remove_from_rating()
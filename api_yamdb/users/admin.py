@@ -1,9 +1,16 @@
 from django.contrib import admin
 
-from .models import User
+from .models import OutgoingEmail, User
 
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     list_display = ('username', 'email', 'role')
     list_editable = ('role',)
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ('pk', 'subject', 'recipients', 'attempts', 'sent_at')
+    list_filter = ('sent_at',)
+    search_fields = ('recipients',)
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed, InvalidToken
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import User
+
+USER_SNAPSHOT_KEY = 'users:jwt:{user_id}'
+USER_SNAPSHOT_FIELDS = ('id', 'username', 'role', 'is_superuser', 'is_active')
+
+
+def get_snapshot_caches():
+    """Возвращает кэш процесса и общий кэш снимков пользователей."""
+    return (
+        caches[settings.JWT_USER_LOCAL_CACHE_ALIAS],
+        caches[settings.JWT_USER_CACHE_ALIAS],
+    )
+
+
+def invalidate_user_snapshot(user_id):
+    """Удаляет снимок пользователя из кэшей."""
+    key = USER_SNAPSHOT_KEY.format(user_id=user_id)
+    for cache in get_snapshot_caches():
+        cache.delete(key)
+
+
+def user_from_snapshot(snapshot):
+    """Собирает пользователя из снимка без обращения к БД.
+
+    Объект содержит только поля снимка и не предназначен для
+    сохранения; для изменения профиля пользователь читается из БД.
+    """
+    user = User(**dict(zip(USER_SNAPSHOT_FIELDS, snapshot)))
+    user._state.adding = False
+    user._state.db = User.objects.db
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT-аутентификация с кэшированием снимка пользователя.
+
+    Снимок (id, username, role, is_superuser, is_active) ищется сначала
+    в кэше процесса, затем в общем кэше и только потом в БД. Сигналы
+    удаляют снимок при изменении или удалении пользователя, но только
+    в кэшах своего процесса: в остальных снимок живет до истечения
+    JWT_USER_CACHE_TIMEOUT.
+    """
+
+    def get_user(self, validated_token):
+        if getattr(api_settings, 'CHECK_REVOKE_TOKEN', False):
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(
+                _('Token contained no recognizable user identification')
+            )
+
+        key = USER_SNAPSHOT_KEY.format(user_id=user_id)
+        local_cache, shared_cache = get_snapshot_caches()
+        snapshot = local_cache.get(key)
+        if snapshot is None:
+            snapshot = shared_cache.get(key)
+            if snapshot is None:
+                user = super().get_user(validated_token)
+                snapshot = tuple(
+                    getattr(user, field) for field in USER_SNAPSHOT_FIELDS
+                )
+                shared_cache.set(
+                    key, snapshot, settings.JWT_USER_CACHE_TIMEOUT
+                )
+                local_cache.set(key, snapshot)
+                return user
+            local_cache.set(key, snapshot)
+
+        user = user_from_snapshot(snapshot)
+        if not user.is_active:
+            raise AuthenticationFailed(
+                _('User is inactive'), code='user_inactive'
+            )
+        return user
@@ -0,0 +1,139 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from users.models import OutgoingEmail
+
+# Пока пачка отправляется, ее письма скрыты от других обработчиков.
+CLAIM_LEASE = timedelta(minutes=5)
+
+
+class Command(BaseCommand):
+    """Отправляет письма из очереди через одно SMTP-соединение."""
+
+    help = 'Отправляет письма из очереди OutgoingEmail.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            help='Количество писем в одной пачке.'
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            help='После стольких неудач письмо больше не отправляется.'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Работать постоянно, опрашивая очередь.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Пауза между опросами пустой очереди, в секундах.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = self.process_batch(
+                options['batch_size'], options['max_attempts']
+            )
+            if sent or failed:
+                self.stdout.write(
+                    f'Отправлено: {sent}, с ошибкой: {failed}'
+                )
+            if not options['loop']:
+                return
+            if not (sent or failed):
+                time.sleep(options['interval'])
+
+    def claim_batch(self, batch_size, max_attempts):
+        """Забирает пачку готовых к отправке писем.
+
+        Время следующей попытки сдвигается на CLAIM_LEASE, поэтому
+        параллельный обработчик эти письма не возьмет.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            pending = OutgoingEmail.objects.filter(
+                sent_at__isnull=True,
+                send_after__lte=now,
+                attempts__lt=max_attempts,
+            ).order_by('send_after', 'id')
+            if connection.features.has_select_for_update_skip_locked:
+                pending = pending.select_for_update(skip_locked=True)
+            emails = list(pending[:batch_size])
+            OutgoingEmail.objects.filter(
+                pk__in=[email.pk for email in emails]
+            ).update(send_after=now + CLAIM_LEASE)
+        return emails
+
+    def process_batch(self, batch_size, max_attempts):
+        """Отправляет одну пачку; возвращает число успехов и неудач."""
+        emails = self.claim_batch(batch_size, max_attempts)
+        if not emails:
+            return 0, 0
+        mail_connection = get_connection()
+        try:
+            mail_connection.open()
+        except Exception as error:
+            # Сервер недоступен: вся пачка откладывается как неудачная,
+            # обработчик продолжает работу.
+            for email in emails:
+                email.last_error = str(error)
+            sent, failed = [], emails
+        else:
+            sent, failed = self.send_batch(emails, mail_connection)
+            try:
+                mail_connection.close()
+            except Exception as error:
+                self.stderr.write(f'Ошибка закрытия соединения: {error}')
+
+        now = timezone.now()
+        OutgoingEmail.objects.filter(
+            pk__in=[email.pk for email in sent]
+        ).update(sent_at=now)
+        for email in failed:
+            email.attempts += 1
+            email.send_after = now + timedelta(
+                seconds=settings.EMAIL_OUTBOX_RETRY_DELAY
+                * 2 ** (email.attempts - 1)
+            )
+        OutgoingEmail.objects.bulk_update(
+            failed, ('attempts', 'send_after', 'last_error')
+        )
+        return len(sent), len(failed)
+
+    def send_batch(self, emails, mail_connection):
+        """Отправляет письма через открытое соединение.
+
+        Возвращает отправленные и неудачные письма.
+        """
+        sent = []
+        failed = []
+        for email in emails:
+            message = EmailMessage(
+                email.subject,
+                email.body,
+                email.from_email,
+                email.recipient_list,
+                connection=mail_connection,
+            )
+            try:
+                message.send()
+            except Exception as error:
+                email.last_error = str(error)
+                failed.append(email)
+            else:
+                sent.append(email)
+        return sent, failed
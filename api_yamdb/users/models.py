@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils import timezone
 
 
 class User(AbstractUser):
@@ -42,3 +43,42 @@ class User(AbstractUser):
     @property
     def is_admin(self):
         return self.role == User.ADMIN or self.is_superuser
+
+
+class OutgoingEmail(models.Model):
+    """Письмо в очереди на отправку.
+
+    Письма отправляет команда send_queued_emails; до успешной отправки
+    sent_at пуст, а send_after задает время следующей попытки.
+    """
+
+    subject = models.CharField('Тема', max_length=255)
+    body = models.TextField('Текст')
+    from_email = models.CharField('Отправитель', max_length=254)
+    recipients = models.TextField('Получатели')
+    created_at = models.DateTimeField('Создано', auto_now_add=True)
+    send_after = models.DateTimeField(
+        'Отправить после',
+        default=timezone.now,
+    )
+    attempts = models.PositiveSmallIntegerField('Попытки', default=0)
+    last_error = models.TextField('Последняя ошибка', blank=True)
+    sent_at = models.DateTimeField('Отправлено', null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=('send_after',),
+                condition=models.Q(sent_at__isnull=True),
+                name='users_outgoing_email_pending',
+            ),
+        ]
+        ordering = ('id',)
+        verbose_name = 'Исходящее письмо'
+
+    def __str__(self):
+        return f'{self.subject} → {self.recipients}'
+
+    @property
+    def recipient_list(self):
+        return self.recipients.split()
@@ -1,25 +1,42 @@
+from django.db import IntegrityError
+from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.exceptions import NotFound
-from rest_framework.validators import UniqueTogetherValidator
+from rest_framework.settings import api_settings
 
+from api.mixins import (
+    EagerLoadingSerializerMixin, SparseFieldsetSerializerMixin
+)
 from users.models import User
-from users.utils import check_confimation_code, get_jwt_token
+from users.utils import (
+    check_confimation_code, get_jwt_token, is_unknown_username,
+    remember_unknown_username
+)
 
 
-class SignUpSerializer(serializers.ModelSerializer):
-    """Сериализатор данных для регистрации."""
+def get_unique_error_message(field):
+    """Сообщение о занятом значении поля, как у UniqueValidator DRF."""
+    return field.error_messages['unique'] % {
+        'model_name': field.model._meta.verbose_name,
+        'field_label': field.verbose_name,
+    }
 
-    class Meta:
-        model = User
-        fields = ('email', 'username')
 
-        validators = [
-            UniqueTogetherValidator(
-                message='Пользователь с таким email уже существует',
-                queryset=User.objects.all(),
-                fields=('email', 'username')
-            )
-        ]
+class SignUpSerializer(serializers.Serializer):
+    """Сериализатор данных для регистрации.
+
+    Уникальность не проверяется отдельными запросами: пользователь
+    находится или создается одним get_or_create, а конфликт по email
+    или username отсекает БД.
+    """
+
+    email = serializers.EmailField(
+        max_length=User._meta.get_field('email').max_length
+    )
+    username = serializers.CharField(
+        max_length=User._meta.get_field('username').max_length,
+        validators=User._meta.get_field('username').validators,
+    )
 
     def validate_username(self, value):
         """Валидация имени пользователя."""
@@ -30,6 +47,37 @@ class SignUpSerializer(serializers.ModelSerializer):
                 'с именем "me".')
         return value
 
+    def create(self, validated_data):
+        """Возвращает существующего пользователя или создает нового."""
+        try:
+            user, _ = User.objects.get_or_create(**validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError(
+                self.get_conflict_errors(validated_data)
+            )
+        return user
+
+    @staticmethod
+    def get_conflict_errors(validated_data):
+        """Ошибки по полям, значения которых уже заняты.
+
+        Формат совпадает с ошибками UniqueValidator, которые API
+        возвращало до перехода на get_or_create.
+        """
+        errors = {}
+        for username, email in User.objects.filter(
+            Q(username=validated_data['username'])
+            | Q(email=validated_data['email'])
+        ).values_list('username', 'email'):
+            for name, value in (('email', email), ('username', username)):
+                if value == validated_data[name]:
+                    errors[name] = [get_unique_error_message(
+                        User._meta.get_field(name)
+                    )]
+        return errors or {api_settings.NON_FIELD_ERRORS_KEY: [
+            'Пользователь с таким email или username уже существует'
+        ]}
+
 
 class TokenSerializer(serializers.Serializer):
     """Cериалайзер для получения токена."""
@@ -38,15 +86,21 @@ class TokenSerializer(serializers.Serializer):
     token = serializers.SerializerMethodField()
 
     def get_token(self, obj):
-        """Проверка кода подтверждения и получение JWT токена."""
+        """Проверка кода подтверждения и получение JWT токена.
+
+        Пользователь читается одним запросом; имена, которых нет в БД,
+        недолго помнятся в кэше и отклоняются без обращения к ней.
+        """
 
         username = obj['username']
-        user_queryset = User.objects.filter(username=username)
-        if not user_queryset.exists():
+        user = None
+        if not is_unknown_username(username):
+            user = User.objects.filter(username=username).first()
+        if user is None:
+            remember_unknown_username(username)
             raise NotFound(
                 detail=f'Пользователя с именем {username} не существует'
             )
-        user = User.objects.get(username=username)
         confirmation_code = self.initial_data.get('confirmation_code')
         if not check_confimation_code(
                 user=user,
@@ -58,7 +112,9 @@ class TokenSerializer(serializers.Serializer):
         return {'token': self.get_token(instance)}
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetSerializerMixin,
+                     EagerLoadingSerializerMixin,
+                     serializers.ModelSerializer):
     """Сериализатор для пользователей."""
 
     class Meta:
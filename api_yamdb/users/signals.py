@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.authentication import invalidate_user_snapshot
+from users.models import User
+from users.utils import forget_unknown_username
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def reset_user_snapshot(sender, instance, **kwargs):
+    """Сбрасывает кэшированный снимок пользователя при его изменении."""
+    invalidate_user_snapshot(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def reset_unknown_username(sender, instance, **kwargs):
+    """Новое или переименованное имя больше не считается отсутствующим."""
+    forget_unknown_username(instance.username)
@@ -1,15 +1,35 @@
+from hashlib import md5
+
+from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import caches
 from django.core.mail import send_mail
-from django.shortcuts import get_object_or_404
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from users.models import User
+from users.models import OutgoingEmail
+
+UNKNOWN_USERNAME_KEY = 'users:unknown:{username}'
+
 
+def queue_mail(subject, message, from_email, recipient_list):
+    """Ставит письмо в очередь или отправляет сразу.
+
+    При EMAIL_OUTBOX_ENABLED письмо только сохраняется в таблицу
+    очереди, а отправляет его команда send_queued_emails.
+    """
+    if not settings.EMAIL_OUTBOX_ENABLED:
+        return send_mail(subject, message, from_email, recipient_list)
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        from_email=from_email,
+        recipients='\n'.join(recipient_list),
+    )
 
-def generate_and_send_confirmation_code(request):
+
+def generate_and_send_confirmation_code(user):
     """Генерация кода подтверждения и его отправка."""
-    user = get_object_or_404(User, username=request.data.get('username'))
-    send_mail(
+    queue_mail(
         'Yamdb. Confirmation code',
         f'confirmation_code: {default_token_generator.make_token(user)}',
         'a@yambd.face',
@@ -26,3 +46,36 @@ def get_jwt_token(user):
     """Получение JWT токена для пользователя."""
     refresh = RefreshToken.for_user(user)
     return str(refresh.access_token)
+
+
+def get_unknown_username_key(username):
+    """Ключ кэша для отсутствующего имени пользователя."""
+    return UNKNOWN_USERNAME_KEY.format(
+        username=md5(username.encode()).hexdigest()
+    )
+
+
+def is_unknown_username(username):
+    """Проверяет, что имя недавно не нашлось в БД."""
+    if not settings.TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT:
+        return False
+    return caches[settings.TOKEN_UNKNOWN_USERNAME_CACHE_ALIAS].get(
+        get_unknown_username_key(username), False
+    )
+
+
+def remember_unknown_username(username):
+    """Запоминает имя, которого нет в БД."""
+    if settings.TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT:
+        caches[settings.TOKEN_UNKNOWN_USERNAME_CACHE_ALIAS].set(
+            get_unknown_username_key(username),
+            True,
+            settings.TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT
+        )
+
+
+def forget_unknown_username(username):
+    """Забывает имя, например после регистрации пользователя."""
+    caches[settings.TOKEN_UNKNOWN_USERNAME_CACHE_ALIAS].delete(
+        get_unknown_username_key(username)
+    )
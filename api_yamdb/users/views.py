@@ -6,13 +6,15 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from api_yamdb.throttling import AuthRateThrottle
+from api.mixins import EagerLoadingViewSetMixin
 from users.models import User
 from users.permission import IsAdmin
 from users.serializers import SignUpSerializer, TokenSerializer, UserSerializer
 from users.utils import generate_and_send_confirmation_code
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(EagerLoadingViewSetMixin, viewsets.ModelViewSet):
     """Вьюсет для работы с пользователями."""
 
     queryset = User.objects.all()
@@ -52,20 +54,13 @@ class UserViewSet(viewsets.ModelViewSet):
 class SignUp(APIView):
     """Вью-функция для регистрации и подтверждения по почте."""
     permission_classes = (AllowAny,)
+    throttle_classes = (AuthRateThrottle,)
 
     def post(self, request):
         """Обрабатывает POST-запрос для регистрации пользователя."""
-        if User.objects.filter(
-            username=request.data.get('username'),
-            email=request.data.get('email')
-        ).exists():
-            generate_and_send_confirmation_code(request)
-            return Response(request.data, status=status.HTTP_200_OK)
-
         serializer = SignUpSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save(username=request.data.get('username'))
-        generate_and_send_confirmation_code(request)
+        generate_and_send_confirmation_code(serializer.save())
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     def perform_create(self, serializer):
@@ -76,6 +71,7 @@ class SignUp(APIView):
 class Token(APIView):
     """Вьюсет для получения токена."""
     permission_classes = (AllowAny,)
+    throttle_classes = (AuthRateThrottle,)
 
     def post(self, request):
         """POST-запрос на получение JWT-токена."""
@@ -0,0 +1,117 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_rating(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_follows_reviews(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(
+            admin_client, title_id, 'review', 4
+        ).json()
+        create_single_review(user_client, title_id, 'review', 9)
+        assert self.get_rating(admin_client, title_id) == 6, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при создании отзыва.'
+        )
+
+        response = admin_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'score': 10}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert self.get_rating(admin_client, title_id) == 9, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при изменении оценки отзыва.'
+        )
+
+        response = admin_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert self.get_rating(admin_client, title_id) == 9, (
+            'Проверьте, что рейтинг произведения пересчитывается '
+            'при удалении отзыва.'
+        )
+
+    def test_02_recalculate_ratings_command(self, admin_client, user_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(admin_client, title_id, 'review', 3)
+        create_single_review(user_client, title_id, 'review', 8)
+        Title.objects.update(rating_sum=0, rating_count=0, rating=None)
+
+        call_command('recalculate_ratings')
+
+        title = Title.objects.get(pk=title_id)
+        assert (title.rating_sum, title.rating_count) == (11, 2)
+        assert title.rating == 5.5
+        assert Title.objects.get(pk=titles[1]['id']).rating is None
+
+    def test_03_stale_instances(self, admin_client):
+        from reviews.models import Review, Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review_id = create_single_review(
+            admin_client, title_id, 'review', 4
+        ).json()['id']
+        first = Review.objects.get(pk=review_id)
+        second = Review.objects.get(pk=review_id)
+        first.score = 6
+        first.save()
+        second.score = 8
+        second.save()
+        title = Title.objects.get(pk=title_id)
+        assert (title.rating_sum, title.rating_count) == (8, 1), (
+            'Проверьте, что при сохранении отзыва старая оценка '
+            'перечитывается из БД, а не берется из загруженного объекта.'
+        )
+
+    def test_04_bulk_and_cascade_deletes(self, admin_client, user_client,
+                                         user):
+        from reviews.models import Review, Title
+
+        titles, _, _ = create_titles(admin_client)
+        for title in titles[:2]:
+            create_single_review(admin_client, title['id'], 'review', 2)
+            create_single_review(user_client, title['id'], 'review', 6)
+
+        user.delete()
+        for title in titles[:2]:
+            title = Title.objects.get(pk=title['id'])
+            assert (title.rating_sum, title.rating_count) == (2, 1), (
+                'Проверьте, что при удалении пользователя оценки его '
+                'отзывов убираются из рейтинга.'
+            )
+
+        Review.objects.filter(title_id=titles[0]['id']).delete()
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.rating_sum, title.rating_count, title.rating) == (
+            0, 0, None
+        ), 'Проверьте, что удаление отзывов через QuerySet меняет рейтинг.'
+        assert Title.objects.get(pk=titles[1]['id']).rating == 2
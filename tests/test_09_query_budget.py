@@ -0,0 +1,155 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import (
+    check_query_budget, create_comments, create_single_review, create_titles
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09QueryBudget:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def create_more_titles(self, admin_client, genres, categories, amount):
+        for idx in range(amount):
+            response = admin_client.post(self.TITLES_URL, data={
+                'name': f'Произведение {idx}',
+                'year': 2000,
+                'genre': [genre['slug'] for genre in genres],
+                'category': categories[idx % len(categories)]['slug'],
+            })
+            assert response.status_code == HTTPStatus.CREATED
+
+    def test_01_titles_queries_do_not_depend_on_page(self, client,
+                                                     admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        self.create_more_titles(admin_client, genres, categories, 8)
+
+        response = check_query_budget(client, self.TITLES_URL, 3)
+        assert len(response.json()['results']) == 10
+        check_query_budget(
+            client,
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            2
+        )
+
+    def test_02_reviews_and_comments_queries(self, client, admin_client,
+                                             admin, user_client, user,
+                                             moderator_client, moderator):
+        authors_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        _, reviews, titles = create_comments(admin_client, authors_map)
+        create_single_review(user_client, titles[1]['id'], 'review', 5)
+
+        check_query_budget(
+            client,
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            3
+        )
+        check_query_budget(
+            client,
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            ),
+            3
+        )
+
+    def test_03_title_write_response(self, admin_client):
+        _, categories, genres = create_titles(admin_client)
+        data = {
+            'name': 'Новое произведение',
+            'year': 2000,
+            'genre': [genres[1]['slug'], genres[0]['slug']],
+            'category': categories[0]['slug'],
+        }
+        response = check_query_budget(
+            admin_client, self.TITLES_URL, 10, method='post', data=data
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.json()['genre'] == [genres[1], genres[0]], (
+            'Проверьте, что ответ на POST-запрос к `/api/v1/titles/` '
+            'содержит жанры в том же порядке, что и GET-запрос.'
+        )
+        assert response.json()['rating'] is None
+
+        response = check_query_budget(
+            admin_client,
+            self.TITLE_DETAIL_URL_TEMPLATE.format(
+                title_id=response.json()['id']
+            ),
+            11,
+            method='patch',
+            data={'genre': [genres[2]['slug']]}
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['genre'] == [genres[2]]
+
+    def test_04_nested_writes(self, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        response = check_query_budget(
+            user_client, url, 5, method='post', data={'text': 't', 'score': 5}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        duplicate = user_client.post(url, data={'text': 't', 'score': 1})
+        assert duplicate.status_code == HTTPStatus.BAD_REQUEST
+        assert 'non_field_errors' in duplicate.json(), (
+            'Проверьте, что повторный отзыв возвращает ошибку валидации '
+            'в ключе `non_field_errors`.'
+        )
+        response = check_query_budget(
+            user_client,
+            self.COMMENTS_URL_TEMPLATE.format(
+                title_id=titles[0]['id'], review_id=response.json()['id']
+            ),
+            3,
+            method='post',
+            data={'text': 't'}
+        )
+        assert response.status_code == HTTPStatus.CREATED
+
+    def count_delete_queries(self, reviews_amount):
+        from reviews.models import Comment, Review, Title
+        from users.models import User
+
+        title = Title.objects.create(name='Произведение', year=2000)
+        authors = [
+            User.objects.create(
+                username=f'author{reviews_amount}_{idx}',
+                email=f'author{reviews_amount}_{idx}@yamdb.fake'
+            )
+            for idx in range(reviews_amount)
+        ]
+        for author in authors:
+            review = Review.objects.create(
+                title=title, author=author, text='text', score=5
+            )
+            Comment.objects.create(review=review, author=author, text='t')
+        with CaptureQueriesContext(connection) as user_context:
+            authors[0].delete()
+        with CaptureQueriesContext(connection) as title_context:
+            title.delete()
+        return (
+            len(user_context.captured_queries),
+            len(title_context.captured_queries),
+        )
+
+    def test_05_cascade_delete_queries(self):
+        assert self.count_delete_queries(2) == (
+            self.count_delete_queries(20)
+        ), (
+            'Проверьте, что количество запросов при удалении пользователя '
+            'и произведения не зависит от количества отзывов.'
+        )
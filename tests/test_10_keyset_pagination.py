@@ -0,0 +1,113 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_query_budget
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10KeysetPagination:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def collect(self, client, url):
+        results = []
+        pages = 0
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            data = response.json()
+            assert 'count' not in data, (
+                'Проверьте, что в режиме cursor ключ `count` возвращается '
+                'только при `count=true`.'
+            )
+            results.extend(data['results'])
+            url = data['next']
+            pages += 1
+        return results, pages
+
+    def test_01_titles_keyset_order(self, client):
+        from reviews.models import Title
+
+        ratings = [None, 5.0, 7.5, 5.0, None, 9.0, 1.0] * 2
+        for idx, rating in enumerate(ratings):
+            Title.objects.create(name=f'title {idx}', year=2000,
+                                 rating=rating)
+        expected = [
+            title.id for title in sorted(
+                Title.objects.all(),
+                key=lambda title: (
+                    title.rating is None, -(title.rating or 0), title.id
+                )
+            )
+        ]
+
+        results, pages = self.collect(client, f'{self.TITLES_URL}?cursor=')
+        assert [title['id'] for title in results] == expected, (
+            'Проверьте, что в режиме cursor произведения упорядочены по '
+            'убыванию рейтинга и по id, а страницы не теряют и не '
+            'повторяют объекты.'
+        )
+        assert pages == 2
+
+    def test_02_reviews_keyset_with_count(self, client, django_user_model):
+        from reviews.models import Review, Title
+
+        title = Title.objects.create(name='title', year=2000)
+        for idx in range(15):
+            author = django_user_model.objects.create_user(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            Review.objects.create(title=title, author=author,
+                                  text='text', score=5)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+
+        response = check_query_budget(client, f'{url}?cursor=', 2)
+        data = response.json()
+        assert 'count' not in data
+        assert len(data['results']) == 10
+
+        response = client.get(data['next'] + '&count=true')
+        data = response.json()
+        assert data['count'] == 15
+        assert data['next'] is None
+        assert len(data['results']) == 5
+
+        response = client.get(f'{url}?cursor=broken')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_titles_keyset_follows_ordering(self, client):
+        from reviews.models import Title
+
+        ratings = [None, 5.0, 7.5, 5.0, None, 9.0, 1.0] * 2
+        for idx, rating in enumerate(ratings):
+            Title.objects.create(name=f'title {idx}', year=2000,
+                                 rating=rating)
+        expected = [
+            title.id for title in sorted(
+                Title.objects.all(),
+                key=lambda title: (
+                    title.rating is None, title.rating or 0, title.id
+                )
+            )
+        ]
+
+        results, _ = self.collect(
+            client, f'{self.TITLES_URL}?cursor=&ordering=rating'
+        )
+        assert [title['id'] for title in results] == expected, (
+            'Проверьте, что в режиме cursor учитывается параметр '
+            '`ordering`.'
+        )
+
+    def test_04_cursor_with_search_rejected(self, client):
+        from reviews.models import Title
+
+        Title.objects.create(name='Властелин колец', year=2000)
+        response = client.get(f'{self.TITLES_URL}?cursor=&search=колец')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что курсор с сортировкой по релевантности поиска '
+            'возвращает ошибку 400, а не теряет сортировку.'
+        )
+        assert 'cursor' in response.json()
@@ -0,0 +1,48 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_query_budget, create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11ListCache:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    GENRES_URL = '/api/v1/genres/'
+
+    def test_01_categories_cache(self, client, admin_client):
+        categories = create_categories(admin_client)
+        client.get(self.CATEGORIES_URL)
+        response = check_query_budget(client, self.CATEGORIES_URL, 0)
+        assert response.json()['count'] == len(categories), (
+            'Проверьте, что повторный GET-запрос к `/api/v1/categories/` '
+            'отдается из кэша.'
+        )
+
+        response = client.get(self.CATEGORIES_URL, {'search': 'Фильм'})
+        assert response.json()['count'] == 1, (
+            'Проверьте, что кэш учитывает параметры запроса.'
+        )
+
+        response = admin_client.delete(
+            f'{self.CATEGORIES_URL}{categories[0]["slug"]}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = client.get(self.CATEGORIES_URL)
+        assert response.json()['count'] == len(categories) - 1, (
+            'Проверьте, что удаление категории сбрасывает кэш списка.'
+        )
+
+    def test_02_genres_cache(self, client, admin_client):
+        genres = create_genre(admin_client)
+        client.get(self.GENRES_URL)
+        check_query_budget(client, self.GENRES_URL, 0)
+
+        admin_client.post(self.GENRES_URL, data={
+            'name': 'Мюзикл', 'slug': 'musical'
+        })
+        response = client.get(self.GENRES_URL)
+        assert response.json()['count'] == len(genres) + 1, (
+            'Проверьте, что создание жанра сбрасывает кэш списка.'
+        )
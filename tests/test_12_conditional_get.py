@@ -0,0 +1,139 @@
+import time
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import (
+    check_query_budget, create_comments, create_single_review, create_titles
+)
+
+
+def wait_next_second():
+    """Ждет начала следующей секунды, после которой отдается
+    Last-Modified изменений текущей секунды."""
+    time.sleep(1 - time.time() % 1 + 0.01)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ConditionalGet:
+
+    TITLES_URL = '/api/v1/titles/'
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_titles_not_modified(self, client, admin_client):
+        create_titles(admin_client)
+        wait_next_second()
+        response = client.get(self.TITLES_URL)
+        etag = response.get('ETag')
+        assert etag and response.get('Last-Modified'), (
+            'Проверьте, что ответ на GET-запрос к `/api/v1/titles/` '
+            'содержит заголовки ETag и Last-Modified.'
+        )
+
+        response = check_query_budget(
+            client, self.TITLES_URL, 0, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.get('ETag') == etag
+
+        response = client.get(
+            self.TITLES_URL,
+            HTTP_IF_MODIFIED_SINCE=client.get(
+                self.TITLES_URL
+            )['Last-Modified']
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_02_reviews_etag_changes(self, client, admin_client,
+                                     user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        etag = client.get(url)['ETag']
+        other_etag = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )['ETag']
+
+        response = check_query_budget(client, url, 0, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+        create_single_review(user_client, titles[0]['id'], 'text', 5)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что после создания отзыва ETag списка отзывов '
+            'меняется.'
+        )
+        response = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[1]['id']),
+            HTTP_IF_NONE_MATCH=other_etag
+        )
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_03_stamp_touched_after_commit(self, client, admin_client):
+        from django.db import transaction
+        from reviews.models import Category
+
+        create_titles(admin_client)
+        with transaction.atomic():
+            Category.objects.create(name='Новая', slug='new')
+            # Ответ по незафиксированным данным попадает в кэш.
+            etag = client.get(self.TITLES_URL)['ETag']
+        response = client.get(self.TITLES_URL, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что метка версии меняется еще раз после фиксации '
+            'транзакции.'
+        )
+
+    def test_04_change_in_same_second(self, client, admin_client):
+        from reviews.models import Category
+
+        create_titles(admin_client)
+        wait_next_second()
+        last_modified = client.get(self.TITLES_URL)['Last-Modified']
+        Category.objects.create(name='Новая', slug='new')
+        response = client.get(
+            self.TITLES_URL, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что изменение в ту же секунду, что и прошлый '
+            'ответ, не дает 304 на If-Modified-Since.'
+        )
+        assert 'Last-Modified' not in response, (
+            'Проверьте, что Last-Modified не отдается, пока секунда '
+            'изменения не закончилась.'
+        )
+
+    def test_05_author_rename(self, client, admin_client, admin,
+                              user_client, user):
+        _, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        urls = [
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+            + f'{reviews[0]["id"]}/comments/',
+        ]
+        etags = [client.get(url)['ETag'] for url in urls]
+        response = user_client.patch(
+            '/api/v1/users/me/', data={'username': 'renamed'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        for url, etag in zip(urls, etags):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                f'Проверьте, что после смены имени автора ETag `{url}` '
+                'меняется.'
+            )
+
+    def test_06_review_delete(self, client, admin_client, admin,
+                              user_client, user):
+        _, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        etag = client.get(url)['ETag']
+        response = admin_client.delete(f'{url}{reviews[0]["id"]}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что удаление отзыва меняет ETag списка отзывов.'
+        )
@@ -0,0 +1,61 @@
+import csv
+import io
+import os
+
+import pytest
+from django.core.management import call_command
+
+from tests.conftest import MANAGE_PATH
+
+DATA_DIR = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def count_rows(filename):
+    with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as file:
+        return sum(1 for _ in csv.DictReader(file))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13ImportCsv:
+
+    def test_01_import_static_data(self):
+        from reviews.models import Comment, Review, Title
+        from users.models import User
+
+        call_command('import_csv', batch_size=7)
+
+        assert User.objects.count() == count_rows('users.csv')
+        assert Title.objects.count() == count_rows('titles.csv')
+        assert Title.genre.through.objects.count() == count_rows(
+            'genre_title.csv'
+        )
+        assert Review.objects.count() == count_rows('review.csv')
+        assert Comment.objects.count() == count_rows('comments.csv')
+
+        review = Review.objects.get(pk=1)
+        assert review.pub_date.year == 2019, (
+            'Проверьте, что при импорте сохраняется дата публикации из файла.'
+        )
+        title = Title.objects.get(pk=review.title_id)
+        reviews = Review.objects.filter(title=title)
+        assert title.rating_count == reviews.count()
+        assert title.rating_sum == sum(item.score for item in reviews)
+
+    def test_02_import_is_repeatable(self):
+        from reviews.models import Review
+
+        call_command('import_csv', skip_rating=True)
+        call_command('import_csv', ignore_conflicts=True)
+        assert Review.objects.count() == count_rows('review.csv')
+
+    def test_03_repeat_import_reports_skipped_rows(self):
+        call_command('import_csv', skip_rating=True)
+        output = io.StringIO()
+        call_command('import_csv', ignore_conflicts=True, stdout=output)
+        rows = count_rows('review.csv')
+        assert f'review.csv: загружено 0, пропущено {rows}' in (
+            output.getvalue()
+        ), (
+            'Проверьте, что при повторном импорте с --ignore-conflicts '
+            'существующие строки считаются пропущенными, а не загруженными.'
+        )
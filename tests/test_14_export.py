@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import os
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.conftest import MANAGE_PATH
+
+DATA_DIR = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8') as file:
+        return list(csv.DictReader(file))
+
+
+def without_description(rows):
+    return [
+        {key: value for key, value in row.items() if key != 'description'}
+        for row in rows
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14Export:
+
+    EXPORT_URL_TEMPLATE = '/api/v1/export/{dataset}/'
+
+    def test_01_export_permissions(self, client, user_client, admin_client):
+        url = self.EXPORT_URL_TEMPLATE.format(dataset='titles')
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN
+        response = admin_client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset='unknown')
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = admin_client.get(url, {'output': 'xml'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_02_export_stream(self, admin_client):
+        call_command('import_csv')
+        response = admin_client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset='reviews')
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).splitlines()
+        ]
+        assert len(rows) == len(read_csv(os.path.join(DATA_DIR,
+                                                      'review.csv')))
+
+        response = admin_client.get(
+            self.EXPORT_URL_TEMPLATE.format(dataset='titles'),
+            {'output': 'csv'}
+        )
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert without_description(rows) == read_csv(
+            os.path.join(DATA_DIR, 'titles.csv')
+        ), (
+            'Проверьте, что выгрузка в CSV совпадает с форматом static/data.'
+        )
+        assert all('description' in row for row in rows), (
+            'Проверьте, что выгрузка произведений содержит описание.'
+        )
+
+    def test_03_export_command_round_trip(self, tmp_path):
+        from reviews.models import Comment, Review
+
+        call_command('import_csv')
+        call_command('export_data', path=tmp_path)
+        for filename in ('titles.csv', 'genre_title.csv', 'category.csv'):
+            assert without_description(read_csv(tmp_path / filename)) == (
+                read_csv(os.path.join(DATA_DIR, filename))
+            )
+
+        Comment.objects.all().delete()
+        Review.objects.all().delete()
+        call_command(
+            'import_csv', path=tmp_path, ignore_conflicts=True
+        )
+        assert Review.objects.count() == len(read_csv(
+            os.path.join(DATA_DIR, 'review.csv')
+        ))
+        assert Comment.objects.count() == len(read_csv(
+            os.path.join(DATA_DIR, 'comments.csv')
+        ))
+
+    def test_04_title_description_round_trip(self, tmp_path):
+        from reviews.models import Title
+
+        call_command('import_csv')
+        title = Title.objects.order_by('pk').first()
+        title.description = 'Описание, с запятой'
+        title.save()
+        call_command('export_data', path=tmp_path)
+
+        Title.objects.all().delete()
+        call_command('import_csv', path=tmp_path, ignore_conflicts=True)
+        assert Title.objects.get(pk=title.pk).description == (
+            title.description
+        ), (
+            'Проверьте, что описание произведения сохраняется при выгрузке '
+            'и повторной загрузке.'
+        )
@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_query_budget
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15CachedAuthentication:
+
+    CATEGORIES_URL = '/api/v1/categories/'
+    USER_DETAIL_URL_TEMPLATE = '/api/v1/users/{username}/'
+
+    def test_01_authenticated_read_without_user_query(self, user_client):
+        user_client.get(self.CATEGORIES_URL)
+        check_query_budget(user_client, self.CATEGORIES_URL, 0)
+
+    def test_02_role_change_resets_snapshot(self, admin_client, user,
+                                            user_client):
+        data = {'name': 'Фильм', 'slug': 'films'}
+        response = user_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        response = admin_client.patch(
+            self.USER_DETAIL_URL_TEMPLATE.format(username=user.username),
+            data={'role': 'admin'}
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = user_client.post(self.CATEGORIES_URL, data=data)
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что изменение роли пользователя сбрасывает '
+            'закэшированные данные аутентификации.'
+        )
+
+    def test_03_inactive_user_rejected(self, user, user_client):
+        user_client.get(self.CATEGORIES_URL)
+        user.is_active = False
+        user.save()
+        response = user_client.get(self.CATEGORIES_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    def test_04_snapshot_timeout_is_short(self, settings):
+        assert settings.JWT_USER_CACHE_TIMEOUT <= (
+            settings.CACHES[settings.JWT_USER_LOCAL_CACHE_ALIAS]['TIMEOUT']
+        ), (
+            'Проверьте, что снимок пользователя по умолчанию живет не '
+            'дольше, чем в кэше процесса: сброс снимка не доходит до '
+            'других процессов.'
+        )
@@ -0,0 +1,127 @@
+from http import HTTPStatus
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16EmailOutbox:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    VALID_DATA = {
+        'email': 'valid@yamdb.fake',
+        'username': 'valid_username'
+    }
+
+    def test_01_signup_enqueues_email(self, client, settings):
+        from users.models import OutgoingEmail
+
+        settings.EMAIL_OUTBOX_ENABLED = True
+        outbox_before_count = len(mail.outbox)
+        response = client.post(self.URL_SIGNUP, data=self.VALID_DATA)
+        assert response.status_code == HTTPStatus.OK
+        assert len(mail.outbox) == outbox_before_count, (
+            'Проверьте, что при включенной очереди письмо не отправляется '
+            'во время запроса.'
+        )
+        email = OutgoingEmail.objects.get()
+        assert email.recipient_list == [self.VALID_DATA['email']]
+
+        call_command('send_queued_emails')
+        assert len(mail.outbox) == outbox_before_count + 1
+        assert mail.outbox[-1].to == [self.VALID_DATA['email']]
+        email.refresh_from_db()
+        assert email.sent_at is not None
+
+        call_command('send_queued_emails')
+        assert len(mail.outbox) == outbox_before_count + 1, (
+            'Проверьте, что отправленное письмо не отправляется повторно.'
+        )
+
+    def test_02_failed_email_is_retried_later(self, settings, monkeypatch):
+        from django.core.mail import EmailMessage
+
+        from users.models import OutgoingEmail
+        from users.utils import queue_mail
+
+        settings.EMAIL_OUTBOX_ENABLED = True
+        queue_mail('subject', 'body', 'a@yamdb.fake', ['b@yamdb.fake'])
+
+        def fail(self, fail_silently=False):
+            raise ConnectionError('smtp is down')
+
+        monkeypatch.setattr(EmailMessage, 'send', fail)
+        call_command('send_queued_emails')
+        email = OutgoingEmail.objects.get()
+        assert email.attempts == 1
+        assert email.sent_at is None
+        assert 'smtp is down' in email.last_error
+
+        monkeypatch.undo()
+        call_command('send_queued_emails')
+        email.refresh_from_db()
+        assert email.sent_at is None, (
+            'Проверьте, что повторная попытка откладывается.'
+        )
+
+    def test_03_signup_queries(self, client, settings):
+        from tests.utils import check_query_budget
+
+        settings.EMAIL_OUTBOX_ENABLED = True
+        response = check_query_budget(
+            client, self.URL_SIGNUP, 5, method='post', data=self.VALID_DATA
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = check_query_budget(
+            client, self.URL_SIGNUP, 2, method='post', data=self.VALID_DATA
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что повторная регистрация возвращает статус 200.'
+        )
+
+    def test_04_signup_conflict_errors(self, client, settings):
+        settings.EMAIL_OUTBOX_ENABLED = True
+        client.post(self.URL_SIGNUP, data=self.VALID_DATA)
+        cases = (
+            ({'email': 'other@yamdb.fake'}, {'username'}),
+            ({'username': 'other_username'}, {'email'}),
+        )
+        for changes, fields in cases:
+            response = client.post(
+                self.URL_SIGNUP, data={**self.VALID_DATA, **changes}
+            )
+            assert response.status_code == HTTPStatus.BAD_REQUEST
+            errors = response.json()
+            assert isinstance(errors, dict) and set(errors) == fields, (
+                'Проверьте, что при занятом email или username ошибка '
+                'возвращается в ключе соответствующего поля.'
+            )
+
+    def test_05_connection_failure_is_retried(self, settings, monkeypatch):
+        from django.core.mail.backends.locmem import EmailBackend
+
+        from users.management.commands.send_queued_emails import Command
+        from users.models import OutgoingEmail
+        from users.utils import queue_mail
+
+        settings.EMAIL_OUTBOX_ENABLED = True
+        for index in range(2):
+            queue_mail('subject', 'body', 'a@yamdb.fake', [f'{index}@b.fake'])
+
+        def fail(self):
+            raise ConnectionRefusedError('smtp is down')
+
+        monkeypatch.setattr(EmailBackend, 'open', fail)
+        assert Command().process_batch(10, 5) == (0, 2), (
+            'Проверьте, что ошибка открытия SMTP-соединения не завершает '
+            'обработчик, а вся пачка считается неудачной.'
+        )
+        for email in OutgoingEmail.objects.all():
+            assert email.attempts == 1
+            assert email.sent_at is None
+            assert 'smtp is down' in email.last_error
+            assert email.send_after > email.created_at, (
+                'Проверьте, что после ошибки соединения повторная попытка '
+                'откладывается.'
+            )
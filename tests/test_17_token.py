@@ -0,0 +1,59 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_query_budget
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17Token:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+    URL_TOKEN = '/api/v1/auth/token/'
+
+    def test_01_token_single_query(self, client, user):
+        from django.contrib.auth.tokens import default_token_generator
+
+        data = {
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user)
+        }
+        response = check_query_budget(
+            client, self.URL_TOKEN, 1, method='post', data=data
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json().get('token')
+
+    def test_02_unknown_username_is_remembered(self, client, settings):
+        settings.TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT = 60
+        data = {'username': 'new_user', 'confirmation_code': '12345'}
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        response = check_query_budget(
+            client, self.URL_TOKEN, 0, method='post', data=data
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+        client.post(self.URL_SIGNUP, data={
+            'username': 'new_user', 'email': 'new_user@yamdb.fake'
+        })
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что после регистрации имя пользователя больше '
+            'не считается несуществующим.'
+        )
+
+    def test_03_unknown_username_cache_is_opt_in(self, client, settings):
+        assert settings.TOKEN_UNKNOWN_USERNAME_CACHE_TIMEOUT == 0, (
+            'Проверьте, что кэш несуществующих имен по умолчанию выключен.'
+        )
+        data = {'username': 'new_user', 'confirmation_code': '12345'}
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        from django.core.cache import caches
+
+        from users.utils import get_unknown_username_key
+
+        assert caches[settings.TOKEN_UNKNOWN_USERNAME_CACHE_ALIAS].get(
+            get_unknown_username_key('new_user')
+        ) is None
@@ -0,0 +1,97 @@
+from http import HTTPStatus
+
+import pytest
+
+from api_yamdb.throttling import TokenBucketRateThrottle
+
+
+@pytest.fixture
+def throttle_rates(monkeypatch):
+    rates = {'auth': '2/min', 'reviews': '1/min', 'comments': '1/min'}
+    monkeypatch.setattr(TokenBucketRateThrottle, 'THROTTLE_RATES', rates)
+    return rates
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18Throttling:
+
+    URL_TOKEN = '/api/v1/auth/token/'
+    URL_REVIEWS = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_auth_throttled_by_ip(self, client, throttle_rates):
+        data = {'username': 'unknown', 'confirmation_code': '12345'}
+        for _ in range(2):
+            response = client.post(self.URL_TOKEN, data=data)
+            assert response.status_code == HTTPStatus.NOT_FOUND
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что запросы к `/api/v1/auth/token/` сверх лимита '
+            'отклоняются со статусом 429.'
+        )
+        assert int(response['Retry-After']) > 0
+
+        response = client.post(
+            self.URL_TOKEN, data=data, HTTP_X_FORWARDED_FOR='10.0.0.2'
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что подмена заголовка `X-Forwarded-For` '
+            'не сбрасывает лимит по IP.'
+        )
+
+        response = client.post(
+            self.URL_TOKEN, data=data, REMOTE_ADDR='10.0.0.1'
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что лимит регистрации и выдачи токена '
+            'считается отдельно для каждого IP-адреса.'
+        )
+
+    def test_02_reviews_throttled_by_user(self, user_client, admin_client,
+                                          throttle_rates):
+        from reviews.models import Category, Title
+
+        category = Category.objects.create(name='Фильм', slug='film')
+        titles = [
+            Title.objects.create(name=name, year=2000, category=category)
+            for name in ('Первый', 'Второй')
+        ]
+        data = {'text': 'Отзыв', 'score': 5}
+        response = user_client.post(
+            self.URL_REVIEWS.format(title_id=titles[0].id), data=data
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = user_client.post(
+            self.URL_REVIEWS.format(title_id=titles[1].id), data=data
+        )
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что создание отзывов сверх лимита отклоняется '
+            'со статусом 429.'
+        )
+
+        response = user_client.get(
+            self.URL_REVIEWS.format(title_id=titles[0].id)
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что лимит не распространяется на чтение отзывов.'
+        )
+        response = admin_client.post(
+            self.URL_REVIEWS.format(title_id=titles[1].id), data=data
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что лимит на создание отзывов считается отдельно '
+            'для каждого пользователя.'
+        )
+
+    def test_03_buckets_survive_default_cache_clear(self, client,
+                                                    throttle_rates):
+        from django.core.cache import caches
+
+        data = {'username': 'unknown', 'confirmation_code': '12345'}
+        for _ in range(2):
+            client.post(self.URL_TOKEN, data=data)
+        caches['default'].clear()
+        response = client.post(self.URL_TOKEN, data=data)
+        assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS, (
+            'Проверьте, что счетчики лимитов хранятся отдельно от кэша '
+            'по умолчанию и не сбрасываются при его очистке.'
+        )
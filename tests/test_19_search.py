@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19Search:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.fixture
+    def titles(self):
+        from reviews.models import Category, Title
+
+        category = Category.objects.create(name='Книга', slug='book')
+        names = (
+            'Война и мир',
+            'Мир',
+            'Мирная жизнь',
+            'Преступление и наказание',
+        )
+        return {
+            name: Title.objects.create(
+                name=name, year=1869, category=category
+            )
+            for name in names
+        }
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'search': query})
+        assert response.status_code == HTTPStatus.OK
+        return [title['name'] for title in response.json()['results']]
+
+    def test_01_search_by_word_prefix(self, client, titles):
+        found = self.search(client, 'мир')
+        assert set(found) == {'Война и мир', 'Мир', 'Мирная жизнь'}, (
+            'Проверьте, что параметр `search` находит произведения '
+            'по началу слова в названии без учета регистра.'
+        )
+        assert found[0] == 'Мир', (
+            'Проверьте, что результаты поиска упорядочены по релевантности.'
+        )
+        assert self.search(client, 'Война МИР') == ['Война и мир'], (
+            'Проверьте, что при поиске учитываются все слова запроса.'
+        )
+        assert self.search(client, 'ир') == []
+        assert self.search(client, '!!!') == []
+
+    def test_02_search_index_follows_changes(self, client, titles):
+        title = titles['Мир']
+        title.name = 'Отцы и дети'
+        title.save()
+        assert 'Отцы и дети' in self.search(client, 'отцы'), (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'названия произведения.'
+        )
+        assert 'Отцы и дети' not in self.search(client, 'мир')
+
+        titles['Мирная жизнь'].delete()
+        assert self.search(client, 'мирная') == [], (
+            'Проверьте, что удаленные произведения не находятся поиском.'
+        )
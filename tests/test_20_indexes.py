@@ -0,0 +1,65 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments
+
+# Строка плана SQLite вида «SCAN table» без «USING ... INDEX» означает
+# полный просмотр таблицы.
+FULL_SCAN_RE = re.compile(r'^SCAN (\w+)$')
+
+
+def get_full_scans(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        details = [row[-1] for row in cursor.fetchall()]
+    return [
+        detail for detail in details if FULL_SCAN_RE.match(detail.strip())
+    ]
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite',
+    reason='Проверка разбирает план запроса SQLite.'
+)
+@pytest.mark.django_db(transaction=True)
+class Test20Indexes:
+
+    def test_01_list_endpoints_use_indexes(self, admin_client, admin,
+                                           user_client, user):
+        authors_map = {admin: admin_client, user: user_client}
+        comments, reviews, titles = create_comments(admin_client, authors_map)
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        title = titles[0]
+        urls = (
+            '/api/v1/categories/',
+            '/api/v1/genres/',
+            '/api/v1/titles/',
+            '/api/v1/titles/?cursor=',
+            f'/api/v1/titles/?category={title["category"]}',
+            f'/api/v1/titles/?genre={title["genre"][0]}',
+            f'/api/v1/titles/?year={title["year"]}',
+            '/api/v1/titles/?search=терминатор',
+            f'/api/v1/titles/{title_id}/reviews/',
+            f'/api/v1/titles/{title_id}/reviews/?cursor=',
+            f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/',
+            f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+            '?cursor=',
+            '/api/v1/users/',
+        )
+        for url in urls:
+            with CaptureQueriesContext(connection) as context:
+                response = admin_client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            for query in context.captured_queries:
+                if not query['sql'].startswith('SELECT'):
+                    continue
+                full_scans = get_full_scans(query['sql'])
+                assert not full_scans, (
+                    f'Проверьте, что запросы списка `{url}` используют '
+                    f'индексы. Полный просмотр {full_scans} в запросе:\n'
+                    f'{query["sql"]}'
+                )
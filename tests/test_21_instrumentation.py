@@ -0,0 +1,64 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def metrics_store():
+    from api_yamdb.instrumentation import metrics_store
+
+    metrics_store.clear()
+    yield metrics_store
+    metrics_store.clear()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21Instrumentation:
+
+    TITLES_URL = '/api/v1/titles/'
+    METRICS_URL = '/api/v1/_metrics/'
+
+    def test_01_server_timing(self, client, metrics_store):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.TITLES_URL)
+        assert response.status_code == HTTPStatus.OK
+        server_timing = response.get('Server-Timing', '')
+        match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', server_timing)
+        assert match, (
+            'Проверьте, что ответ содержит заголовок `Server-Timing` '
+            'с временем и количеством запросов к БД.'
+        )
+        assert int(match.group(1)) == len(context.captured_queries), (
+            'Проверьте, что в `Server-Timing` указано количество '
+            'выполненных запросов к БД.'
+        )
+        assert 'serialize;dur=' in server_timing
+        assert 'total;dur=' in server_timing
+
+    def test_02_metrics_admin_only(self, client, user_client, admin_client,
+                                   metrics_store):
+        response = client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        response = user_client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что статистика доступна только администратору.'
+        )
+
+        for _ in range(3):
+            client.get(self.TITLES_URL)
+        response = admin_client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK
+        stats = response.json().get('GET api:titles-list')
+        assert stats, (
+            'Проверьте, что `/api/v1/_metrics/` отдает статистику по имени '
+            'маршрута.'
+        )
+        assert stats['count'] == 3
+        for field in ('total_ms', 'db_ms', 'serialize_ms', 'queries'):
+            assert set(stats[field]) == {'p50', 'p95', 'p99', 'max'}, (
+                f'Проверьте, что для `{field}` возвращаются перцентили.'
+            )
+        assert stats['queries']['max'] >= 1
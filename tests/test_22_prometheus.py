@@ -0,0 +1,115 @@
+import subprocess
+import sys
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+WORKER_SCRIPT = (
+    'from api_yamdb.prometheus import REQUESTS; '
+    'REQUESTS.labels("titles-list", "GET", 200).inc()'
+)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22Prometheus:
+
+    METRICS_URL = '/metrics/'
+
+    def get_sample(self, name, **labels):
+        from prometheus_client import REGISTRY
+
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_01_request_metrics(self, client):
+        labels = {'route': 'categories-list', 'method': 'GET'}
+        requests_before = self.get_sample(
+            'yamdb_requests_total', status='200', **labels
+        )
+        duration_before = self.get_sample(
+            'yamdb_request_duration_seconds_count', **labels
+        )
+        misses_before = self.get_sample(
+            'yamdb_list_cache_lookups_total',
+            route='categories-list', result='miss'
+        )
+        hits_before = self.get_sample(
+            'yamdb_list_cache_lookups_total',
+            route='categories-list', result='hit'
+        )
+        client.get('/api/v1/categories/')
+        client.get('/api/v1/categories/')
+
+        assert self.get_sample(
+            'yamdb_requests_total', status='200', **labels
+        ) == requests_before + 2, (
+            'Проверьте, что запросы считаются по имени маршрута DRF, '
+            'методу и статусу ответа.'
+        )
+        assert self.get_sample(
+            'yamdb_request_duration_seconds_count', **labels
+        ) == duration_before + 2
+        assert self.get_sample(
+            'yamdb_list_cache_lookups_total',
+            route='categories-list', result='miss'
+        ) == misses_before + 1
+        assert self.get_sample(
+            'yamdb_list_cache_lookups_total',
+            route='categories-list', result='hit'
+        ) == hits_before + 1, (
+            'Проверьте, что попадания в кэш списков учитываются в метриках.'
+        )
+
+        response = client.get(self.METRICS_URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Type'].startswith('text/plain')
+        content = response.content.decode()
+        assert 'yamdb_request_duration_seconds_bucket{' in content
+        assert 'yamdb_db_queries_per_request_bucket{' in content
+
+    def test_02_workers_are_aggregated(self, tmp_path, monkeypatch):
+        from api_yamdb.prometheus import get_registry
+
+        api_dir = Path(__file__).resolve().parent.parent / 'api_yamdb'
+        for _ in range(2):
+            subprocess.run(
+                [sys.executable, '-c', WORKER_SCRIPT],
+                check=True,
+                cwd=api_dir,
+                env={'PROMETHEUS_MULTIPROC_DIR': str(tmp_path)},
+            )
+        monkeypatch.setenv('PROMETHEUS_MULTIPROC_DIR', str(tmp_path))
+        value = get_registry().get_sample_value('yamdb_requests_total', {
+            'route': 'titles-list', 'method': 'GET', 'status': '200'
+        })
+        assert value == 2, (
+            'Проверьте, что при заданном PROMETHEUS_MULTIPROC_DIR метрики '
+            'всех воркеров суммируются.'
+        )
+
+    def test_03_metrics_access_and_labels(self, client, settings):
+        from api_yamdb.instrumentation import metrics_store
+
+        response = client.get(self.METRICS_URL, REMOTE_ADDR='10.0.0.5')
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Проверьте, что метрики отдаются только на адреса из '
+            '`PROMETHEUS_ALLOWED_IPS`.'
+        )
+        settings.PROMETHEUS_ALLOWED_IPS = ('10.0.0.5',)
+        response = client.get(self.METRICS_URL, REMOTE_ADDR='10.0.0.5')
+        assert response.status_code == HTTPStatus.OK
+
+        labels = {'route': 'other', 'method': 'other', 'status': '404'}
+        before = self.get_sample('yamdb_requests_total', **labels)
+        for method in ('BREW', 'WHEN'):
+            client.generic(method, f'/{method.lower()}/')
+        assert self.get_sample(
+            'yamdb_requests_total', **labels
+        ) == before + 2, (
+            'Проверьте, что нестандартные методы и адреса без маршрута '
+            'учитываются под меткой `other`.'
+        )
+        assert not any(
+            endpoint.startswith(('BREW', 'WHEN'))
+            for endpoint in metrics_store.samples
+        )
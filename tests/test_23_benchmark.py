@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23Benchmark:
+
+    def test_01_generate_dataset(self):
+        from reviews.models import Comment, Review, Title
+        from users.models import User
+
+        call_command(
+            'generate_dataset', users=4, categories=2, genres=3, titles=5,
+            reviews=3, comments=2, batch_size=4
+        )
+        assert User.objects.count() == 5
+        assert Title.objects.count() == 5
+        assert Review.objects.count() == 15
+        assert Comment.objects.count() == 30
+        assert not Title.objects.filter(rating__isnull=True).exists(), (
+            'Проверьте, что `generate_dataset` пересчитывает рейтинг '
+            'созданных произведений.'
+        )
+        with pytest.raises(CommandError):
+            call_command('generate_dataset')
+
+    def test_02_benchmark_report(self, live_server, tmp_path):
+        call_command(
+            'generate_dataset', users=3, categories=2, genres=2, titles=3,
+            reviews=2, comments=1
+        )
+        output = tmp_path / 'report.json'
+        call_command(
+            'benchmark', url=live_server.url, requests=3, concurrency=2,
+            warmup=0, output=output
+        )
+        report = json.loads(output.read_text(encoding='utf-8'))
+        assert report['dataset']['titles'] == 3
+        routes = report['routes']
+        for name in ('titles-list', 'titles-detail', 'reviews-list',
+                     'comments-detail', 'users-me', 'signup', 'token'):
+            assert name in routes, (
+                f'Проверьте, что `benchmark` нагружает маршрут `{name}`.'
+            )
+        for name, result in routes.items():
+            assert result['requests'] == 3
+            assert result['errors'] == 0, (
+                f'Запросы к `{name}` завершились ошибкой: {result}'
+            )
+            assert set(result['latency_ms']) == {'p50', 'p95', 'p99', 'max'}
+            assert result['rps'] > 0
+        assert routes['titles-list']['statuses'] == {'200': 3}
+        assert routes['users-me']['statuses'] == {'200': 3}
+        for name in ('signup', 'token'):
+            assert routes[name]['statuses'] == {'200': 3}, (
+                f'Проверьте, что `benchmark` замеряет успешные запросы '
+                f'к `{name}`, а не ответы с ошибкой.'
+            )
+        assert routes['titles-detail']['queries_per_request'] >= 1
@@ -0,0 +1,86 @@
+import datetime as dt
+import io
+import json
+import uuid
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.parsers import FastJSONParser
+from api.renderers import FastJSONRenderer
+
+
+class Test24FastJSON:
+
+    def test_01_renderer_is_byte_compatible(self):
+        data = {
+            'pub_date': dt.datetime(
+                2023, 9, 21, 18, 52, 3, 123456, tzinfo=dt.timezone.utc
+            ),
+            'day': dt.date(2023, 9, 21),
+            'time': dt.time(18, 52, 3, 500),
+            'rating': Decimal('7.50'),
+            'score': 7.5,
+            'uuid': uuid.UUID('12345678123456781234567812345678'),
+            'text': 'Отзыв с \u2028разделителями\u2029 "кавычками" \\ \n',
+            'lazy': gettext_lazy('Отзыв'),
+            'error': [ErrorDetail('Ошибка', code='invalid')],
+            'nested': [{'id': 1, 'genre': ()}, None, True, 2 ** 63],
+            1: 'int key',
+        }
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+        assert FastJSONRenderer().render(None) == b''
+        assert (
+            FastJSONRenderer().render(data, 'application/json; indent=4')
+            == JSONRenderer().render(data, 'application/json; indent=4')
+        )
+
+    def test_02_parser(self):
+        parser = FastJSONParser()
+        data = parser.parse(io.BytesIO(
+            json.dumps({'text': 'Отзыв', 'score': 5}).encode()
+        ))
+        assert data == {'text': 'Отзыв', 'score': 5}
+        for body in (b'{"score": ', b'{"score": NaN}'):
+            with pytest.raises(ParseError):
+                parser.parse(io.BytesIO(body))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_api_responses(self, admin_client, user_client):
+        from tests.utils import create_single_review, create_titles
+
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'Отзыв', 7)
+        for url in (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+        ):
+            response = admin_client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            assert response.content == JSONRenderer().render(
+                response.data
+            ), f'Проверьте, что ответ `{url}` не изменился побайтно.'
+
+        response = user_client.post(
+            f'/api/v1/titles/{titles[1]["id"]}/reviews/',
+            data=json.dumps({'text': 'Отзыв', 'score': 9}),
+            content_type='application/json'
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        response = user_client.post(
+            f'/api/v1/titles/{titles[1]["id"]}/reviews/',
+            data='{"text": ',
+            content_type='application/json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+        stdout = io.StringIO()
+        call_command('benchmark_json', page_size=5, repeat=2, stdout=stdout)
+        report = json.loads(stdout.getvalue())
+        assert report['titles']['objects'] == 2
+        assert report['reviews']['objects'] == 2
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import check_query_budget, create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25ValuesRead:
+
+    def get_urls(self, titles, reviews, comments):
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        reviews_url = f'/api/v1/titles/{title_id}/reviews/'
+        comments_url = f'{reviews_url}{review_id}/comments/'
+        return (
+            '/api/v1/titles/',
+            '/api/v1/titles/?cursor=',
+            '/api/v1/titles/?ordering=rating',
+            f'/api/v1/titles/{title_id}/',
+            f'/api/v1/titles/{titles[1]["id"]}/',
+            reviews_url,
+            f'{reviews_url}?cursor=',
+            f'{reviews_url}{review_id}/',
+            comments_url,
+            f'{comments_url}{comments[0]["id"]}/',
+        )
+
+    def test_01_same_output(self, settings, admin_client, admin,
+                            user_client, user):
+        from django.core.cache import cache
+        from reviews.models import Title
+
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        Title.objects.create(name='Без категории', year=2000)
+        urls = self.get_urls(titles, reviews, comments)
+
+        fast = [admin_client.get(url) for url in urls]
+        settings.API_VALUES_READ_PATH = False
+        cache.clear()
+        for url, fast_response in zip(urls, fast):
+            response = admin_client.get(url)
+            assert fast_response.status_code == HTTPStatus.OK
+            assert fast_response.content == response.content, (
+                f'Проверьте, что ответ `{url}` при чтении через values() '
+                'совпадает с ответом сериализатора.'
+            )
+
+    def test_02_query_budget(self, admin_client, admin, user_client, user):
+        comments, reviews, titles = create_comments(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+        urls = self.get_urls(titles, reviews, comments)
+        check_query_budget(user_client, urls[0], 3)
+        check_query_budget(user_client, urls[3], 2)
+        check_query_budget(user_client, urls[5], 3)
+        check_query_budget(user_client, urls[7], 1)
+        response = check_query_budget(user_client, urls[9], 1)
+        assert response.json()['author'] == comments[0]['author']
+        response = user_client.get(f'{urls[5]}{reviews[0]["id"] + 100}/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
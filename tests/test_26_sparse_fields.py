@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import check_query_budget, create_reviews
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26SparseFields:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.mark.parametrize('values_read_path', (True, False))
+    def test_01_titles_fields(self, settings, admin_client, admin,
+                              values_read_path):
+        settings.API_VALUES_READ_PATH = values_read_path
+        create_reviews(admin_client, {admin: admin_client})
+
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.get(
+                f'{self.TITLES_URL}?fields=id,name,rating'
+            )
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert list(title) == ['id', 'name', 'rating'], (
+                'Проверьте, что параметр `fields` оставляет в ответе '
+                'только перечисленные поля.'
+            )
+        assert len(context.captured_queries) == 2, (
+            'Проверьте, что без полей `genre` и `category` связанные '
+            'объекты не загружаются.'
+        )
+        page_sql = context.captured_queries[-1]['sql']
+        assert 'description' not in page_sql, (
+            'Проверьте, что колонки невыбранных полей не читаются из БД.'
+        )
+
+        response = check_query_budget(
+            admin_client, f'{self.TITLES_URL}?omit=genre,description', 2
+        )
+        title = response.json()['results'][0]
+        assert list(title) == ['id', 'name', 'year', 'rating', 'category']
+        assert set(title['category']) == {'name', 'slug'}, (
+            'Проверьте, что вложенные сериализаторы выводятся целиком.'
+        )
+
+        response = admin_client.get(f'{self.TITLES_URL}?fields=id&cursor=')
+        assert response.status_code == HTTPStatus.OK
+        assert 'next' in response.json()
+
+    def test_02_other_serializers(self, admin_client, admin):
+        reviews, titles = create_reviews(admin_client, {admin: admin_client})
+        response = admin_client.get(
+            f'{self.TITLES_URL}{titles[0]["id"]}/reviews/?fields=id,score'
+        )
+        assert list(response.json()['results'][0]) == ['id', 'score']
+        response = admin_client.get('/api/v1/categories/?omit=name')
+        assert list(response.json()['results'][0]) == ['slug']
+        response = admin_client.get('/api/v1/users/?fields=username,role')
+        assert list(response.json()['results'][0]) == ['username', 'role']
+        response = admin_client.get('/api/v1/users/me/?omit=bio')
+        assert 'bio' not in response.json()
+        assert response.json()['username'] == admin.username
+
+    def test_03_invalid_and_write_requests(self, admin_client):
+        response = admin_client.get(f'{self.TITLES_URL}?fields=id,unknown')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что неизвестное поле в `fields` приводит к ответу '
+            'со статусом 400.'
+        )
+        assert 'fields' in response.json()
+
+        response = admin_client.post(
+            '/api/v1/categories/?fields=slug',
+            data={'name': 'Фильм', 'slug': 'film'}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что `fields` не влияет на запросы на запись.'
+        )
+        assert response.json() == {'name': 'Фильм', 'slug': 'film'}
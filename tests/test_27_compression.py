@@ -0,0 +1,107 @@
+import gzip
+import re
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+# Ответы на тестовых данных короче порога по умолчанию.
+MIN_SIZE = 200
+
+
+@pytest.fixture
+def min_size(settings):
+    settings.COMPRESSION_MIN_SIZE = MIN_SIZE
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27Compression:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_gzip(self, admin_client, client, min_size):
+        create_titles(admin_client)
+        plain = client.get(self.TITLES_URL)
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert response.status_code == HTTPStatus.OK
+        assert response.get('Content-Encoding') == 'gzip', (
+            'Проверьте, что JSON-ответ больше порога сжимается в gzip, '
+            'если клиент его принимает.'
+        )
+        assert gzip.decompress(response.content) == plain.content, (
+            'Проверьте, что сжатый ответ совпадает с несжатым.'
+        )
+        assert int(response['Content-Length']) == len(response.content)
+        assert 'Accept-Encoding' in response.get('Vary', '')
+        assert response['ETag'] == f'W/{plain["ETag"]}', (
+            'Проверьте, что ETag сжатого ответа становится слабым.'
+        )
+        assert 'Content-Encoding' not in plain, (
+            'Проверьте, что ответ без `Accept-Encoding` не сжимается.'
+        )
+
+    def test_02_small_response(self, admin_client, client, settings):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.content) < settings.COMPRESSION_MIN_SIZE
+        assert 'Content-Encoding' not in response, (
+            'Проверьте, что ответ меньше `COMPRESSION_MIN_SIZE` '
+            'не сжимается.'
+        )
+
+    def test_03_refused_encoding(self, admin_client, client, min_size):
+        create_titles(admin_client)
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip;q=0, identity'
+        )
+        assert 'Content-Encoding' not in response, (
+            'Проверьте, что кодировка с `q=0` не используется.'
+        )
+
+    def test_04_compressed_cache(
+        self, admin_client, client, min_size, monkeypatch
+    ):
+        from api_yamdb import compression
+
+        create_titles(admin_client)
+        first = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        calls = []
+        original = compression.compress_string
+
+        def compress_string(content):
+            calls.append(content)
+            return original(content)
+
+        monkeypatch.setattr(
+            compression, 'COMPRESSORS', (('gzip', compress_string),)
+        )
+        second = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert second.content == first.content
+        assert not calls, (
+            'Проверьте, что сжатый ответ с тем же ETag берется из кэша '
+            'без повторного сжатия.'
+        )
+
+        client.get(f'{self.TITLES_URL}?limit=5', HTTP_ACCEPT_ENCODING='gzip')
+        assert calls, (
+            'Проверьте, что ответ с другим ETag сжимается заново.'
+        )
+
+    def test_05_server_timing(self, admin_client, client, min_size):
+        create_titles(admin_client)
+        response = client.get(self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip')
+        assert re.search(
+            r'compress;dur=[\d.]+', response.get('Server-Timing', '')
+        ), 'Проверьте, что `Server-Timing` содержит время сжатия.'
+
+    def test_06_brotli(self, admin_client, client, min_size):
+        brotli = pytest.importorskip('brotli')
+        create_titles(admin_client)
+        plain = client.get(self.TITLES_URL)
+        response = client.get(
+            self.TITLES_URL, HTTP_ACCEPT_ENCODING='gzip, br'
+        )
+        assert response.get('Content-Encoding') == 'br'
+        assert brotli.decompress(response.content) == plain.content
@@ -0,0 +1,59 @@
+import pytest
+from django.core.signals import request_started
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+
+@pytest.mark.skipif(
+    connection.vendor != 'sqlite', reason='Проверяются PRAGMA SQLite.'
+)
+class Test28Database:
+
+    @pytest.mark.django_db
+    def test_01_sqlite_pragmas(self, tmp_path, settings):
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, 'NAME': str(tmp_path / 'db.sqlite3')},
+            alias='pragmas',
+        )
+        try:
+            with wrapper.cursor() as cursor:
+                values = {}
+                for name in settings.SQLITE_PRAGMAS:
+                    cursor.execute(f'PRAGMA {name}')
+                    values[name] = cursor.fetchone()[0]
+        finally:
+            wrapper.close()
+        assert values['journal_mode'] == 'wal', (
+            'Проверьте, что новое соединение SQLite переводится в режим WAL.'
+        )
+        assert values['synchronous'] == 1, (
+            'Проверьте, что для соединения SQLite задан '
+            '`synchronous=NORMAL`.'
+        )
+        assert values['busy_timeout'] == (
+            settings.SQLITE_PRAGMAS['busy_timeout']
+        ), 'Проверьте, что для соединения SQLite задан `busy_timeout`.'
+        assert values['mmap_size'] == settings.SQLITE_PRAGMAS['mmap_size']
+
+    @pytest.mark.django_db(transaction=True)
+    def test_02_health_check(self, monkeypatch):
+        connection.ensure_connection()
+        # Django не закрывает тестовую базу SQLite в памяти.
+        closed = []
+        monkeypatch.setattr(connection, 'close', lambda: closed.append(True))
+        monkeypatch.setitem(connection.settings_dict, 'CONN_MAX_AGE', 60)
+        monkeypatch.setitem(
+            connection.settings_dict, 'CONN_HEALTH_CHECKS', True
+        )
+        request_started.send(sender=None)
+        assert not closed, (
+            'Проверьте, что рабочее постоянное соединение не закрывается '
+            'в начале запроса.'
+        )
+
+        monkeypatch.setattr(connection, 'is_usable', lambda: False)
+        request_started.send(sender=None)
+        assert closed, (
+            'Проверьте, что неработающее постоянное соединение '
+            'закрывается в начале запроса.'
+        )
@@ -1,5 +1,8 @@
 from http import HTTPStatus
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 
 check_name_and_slug_patterns = (
     (
@@ -305,3 +308,17 @@ def check_fields(obj_type, url_pattern, obj, expected_data, detail=False):
         f'данные {obj_types[obj_type]}{results_in_msg}. Поле `id` не '
         'найдено или не является целым числом.'
     )
+
+
+def check_query_budget(client, url, budget, method='get', data=None,
+                       **extra):
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url, data=data, **extra)
+    queries_count = len(context.captured_queries)
+    assert queries_count <= budget, (
+        f'Проверьте, что {method.upper()}-запрос к `{url}` выполняет не '
+        f'больше {budget} запросов к БД. Сейчас выполняется '
+        f'{queries_count}:\n'
+        + '\n'.join(query['sql'] for query in context.captured_queries)
+    )
+    return response